@@ -5,35 +5,71 @@
 #              Airport Check-In DES model.
 
 # Python Imports
+from collections import deque
+from itertools import count
+from multiprocessing import Pool
 from typing import Any, Dict, List, Tuple, Union
 
+# Third-Party Imports
+import numpy as np
+
 # Custom Imports
 from source.constants import *
 from source.events import Arrival, Departure, End
 import source.future_event_list as fel
-import source.random_variate_generators as rvg
-
-# Global Variables
-uuid = -1
 
-
-def get_uuid() -> int:
-    """
-    Generates a new UUID.
-    :return: A UUID as an integer.
-    """
-    global uuid
-    uuid += 1
-    return uuid
+# Column indices of the statistics array; rows are indexed by flight class.
+ARRIVAL_COUNT = 0
+DEPARTURE_COUNT = 1
+CUMULATIVE_TIME_BUSY = 2
+CURRENT_QUEUE_LENGTH = 3
+MAXIMUM_QUEUE_LENGTH = 4
+CUMULATIVE_RESPONSE_TIME = 5
+LONG_RESPONSE_COUNT = 6
+CUMULATIVE_INTERARRIVAL_TIME = 7
+CUMULATIVE_SERVICE_TIME = 8
+SERVICE_STARTED_COUNT = 9
+STATISTICS_COUNT = 10
+
+# Number of random variates generated per refill of a variate buffer.
+VARIATE_BLOCK_SIZE = 512
+
+# Keys of the execution parameters and calculated statistics in the output.
+OUTPUT_KEYS = [
+    "interarrival_mean_time",
+    "service_mean_time",
+    "service_std_time",
+    "simulation_run_duration",
+    "transfers_allowed",
+    "number_of_arrivals",
+    "mean_interarrival_time",
+    "maximum_queue_length",
+    "length_at_simulation_end",
+    "server_utilization",
+    "number_of_departures",
+    "mean_response_time",
+    "long_response_ratio",
+    "mean_service_time",
+    "status_at_simulation_end",
+    "economy_class_customers_served",
+    "total_arrivals",
+    "total_departures",
+    "total_in_system_at_simulation_end",
+]
+
+# Formatted names of the output keys, and which keys are measured in minutes.
+PRETTY_KEYS = {key: key.replace("_", " ").capitalize() for key in OUTPUT_KEYS}
+MINUTE_KEYS = {key for key in OUTPUT_KEYS if "time" in key or "duration" in key}
 
 
 def airport_check_in(trial: int,
-                     scenario: str,
+                     scenario: int,
                      interarrival_mean: Tuple[Union[int, float]] = (2, 1),
                      service_mean: Tuple[Union[int, float]] = (2, 1),
                      service_std: Tuple[Union[int, float]] = (0.5, 0.25),
                      long_response_threshold: Tuple[Union[int, float]] = 4,
-                     end_time: int = 120) -> Tuple[float, List[str]]:
+                     end_time: int = 120,
+                     seed: int = None) -> Tuple[float, List[str]]:
     """
     Execute a single trial of the Grocery Checkout DES model.
     :param trial: Trial index.
@@ -46,37 +82,32 @@ def airport_check_in(trial: int,
     'long' response.
     :param end_time: End the simulation when this many time units
     (here, minutes) pass.
+    :param seed: Seed for this trial's random number generator.
     :return: A tuple, where the first three elements are the first class,
     economy, and overall mean response times, and the fourth element is
     the formatted output of the trial's execution parameters and
     calculated statistics.
     """
-    global uuid
-    uuid = -1
-    clock = 0
-    allow_transfers = True if scenario is ALLOW_TRANSFERS else False
-    transfer_count = 0
-    statistics = {
-        flight_class:
-            {
-                "arrival_count": 0,
-                "departure_count": 0,
-                "cumulative_time_busy": 0,
-                "current_queue_length": 0,
-                "maximum_queue_length": 0,
-                "cumulative_response_time": 0,
-                "long_response_count": 0,
-                "cumulative_interarrival_time": 0,
-                "cumulative_service_time": 0,
-                "service_started_count": 0,
-            } for flight_class in [FIRST_CLASS, ECONOMY_CLASS]}
-    states = {
-        flight_class:
-            {
-                "queue": [],
-                "server_status": IDLE,
+    # Run the simulation, then format its results.
+    allow_transfers = scenario == ALLOW_TRANSFERS
+    stats, server_busy, transfer_count, clock = run_simulation(
+        allow_transfers,
+        tuple(interarrival_mean),
+        tuple(service_mean),
+        tuple(service_std),
+        long_response_threshold,
+        end_time,
+        seed,
+    )
 
-            } for flight_class in [FIRST_CLASS, ECONOMY_CLASS]}
+    # Get the total number of arrivals, departures, and remaining entities.
+    total_arrivals = int(stats[FIRST_CLASS, ARRIVAL_COUNT] +
+                       stats[ECONOMY_CLASS, ARRIVAL_COUNT])
+    total_departures = int(stats[FIRST_CLASS, DEPARTURE_COUNT] +
+                           stats[ECONOMY_CLASS, DEPARTURE_COUNT])
+    total_in_system = total_arrivals - total_departures
+
+    # Construct execution parameters for output.
     parameters = {
         flight_class:
             {
@@ -85,18 +116,140 @@ def airport_check_in(trial: int,
                 "service_std": service_std[index],
             } for index, flight_class in
         enumerate([FIRST_CLASS, ECONOMY_CLASS])}
+    parameters = {
+        flight_class: {f"{key}_time": value for key, value in values.items()}
+        for flight_class, values in parameters.items()}
+    execution_parameters = {
+        "simulation_run_duration": end_time,
+        "transfers_allowed": "Yes" if allow_transfers else "No",
+        **parameters,
+    }
+
+    # Calculate statistics for output from the statistics array.
+    calculated_statistics = {}
+    for flight_class in [FIRST_CLASS, ECONOMY_CLASS]:
+        row = stats[flight_class]
+        calculated_statistics[flight_class] = {
+            "number_of_arrivals": int(row[ARRIVAL_COUNT]),
+            "mean_interarrival_time": float(
+                row[CUMULATIVE_INTERARRIVAL_TIME] / row[ARRIVAL_COUNT]),
+            "maximum_queue_length": int(row[MAXIMUM_QUEUE_LENGTH]),
+            "length_at_simulation_end": int(row[CURRENT_QUEUE_LENGTH]),
+            "server_utilization": float(row[CUMULATIVE_TIME_BUSY] / clock),
+            "number_of_departures": int(row[DEPARTURE_COUNT]),
+            "mean_response_time": float(
+                row[CUMULATIVE_RESPONSE_TIME] / row[DEPARTURE_COUNT]),
+            "long_response_ratio": float(
+                row[LONG_RESPONSE_COUNT] / row[DEPARTURE_COUNT]),
+            "mean_service_time": float(
+                row[CUMULATIVE_SERVICE_TIME] / row[SERVICE_STARTED_COUNT]),
+            "status_at_simulation_end":
+                BUSY if server_busy[flight_class] else IDLE,
+        }
+    calculated_statistics[FIRST_CLASS]["economy_class_customers_served"] = \
+        transfer_count
+    calculated_statistics["total_arrivals"] = total_arrivals
+    calculated_statistics["total_departures"] = total_departures
+    calculated_statistics["total_in_system_at_simulation_end"] = total_in_system
+
+    output = format_output(trial,
+                           "Multi-queue, multi-server - Airport Check-In",
+                           execution_parameters,
+                           calculated_statistics)
+
+    # Return the mean response times and the formatted output.
+    overall_mean_response_time = float(
+        (stats[FIRST_CLASS, CUMULATIVE_RESPONSE_TIME] +
+         stats[ECONOMY_CLASS, CUMULATIVE_RESPONSE_TIME]) / total_departures
+    )
+    return (calculated_statistics[FIRST_CLASS]["mean_response_time"],
+            calculated_statistics[ECONOMY_CLASS]["mean_response_time"],
+            overall_mean_response_time,
+            output)
+
+
+def run_simulation(allow_transfers: bool,
+                   interarrival_means: Tuple[Union[int, float], ...],
+                   service_means: Tuple[Union[int, float], ...],
+                   service_stds: Tuple[Union[int, float], ...],
+                   long_response_threshold: Union[int, float],
+                   end_time: int,
+                   seed: int = None) -> Tuple[np.ndarray, np.ndarray, int,
+                                              float]:
+    """
+    Run the event loop of the Airport Check-In DES model until end_time.
+    :param allow_transfers: Whether economy-class entities may be served by
+    the first-class server.
+    :param interarrival_means: Average times between arrivals, indexed by
+    flight class.
+    :param service_means: Average times for servicing entities, indexed by
+    flight class.
+    :param service_stds: Standard deviations for servicing entities, indexed
+    by flight class.
+    :param long_response_threshold: Threshold for a service to be considered a
+    'long' response.
+    :param end_time: End the simulation when this many time units
+    (here, minutes) pass.
+    :param seed: Seed for this trial's random number generator.
+    :return: A tuple of the statistics array, the final server states, the
+    number of transfers, and the final simulation time.
+    """
+    next_uuid = count().__next__  # Generates a new UUID per event.
+    clock = 0
+    transfer_count = 0
+
+    # Statistics and server states are indexed by flight class.
+    stats = np.zeros((2, STATISTICS_COUNT))
+    queues = (deque(), deque())
+    server_busy = np.zeros(2, dtype=np.int8)  # 1 while a server is busy.
+
+    # Random variates are generated in blocks and consumed one at a time,
+    # with one buffer per flight class.
+    rng = np.random.default_rng(seed)
+    interarrival_buffers = ([], [])
+    service_buffers = ([], [])
+
+    def next_interarrival_time(flight_class: int) -> float:
+        """
+        Take the next exponential interarrival time for a flight class.
+        :param flight_class: The flight class of the arriving entity.
+        :return: A random variate from the exponential distribution.
+        """
+        buffer = interarrival_buffers[flight_class]
+        if not buffer:
+            buffer.extend(rng.exponential(interarrival_means[flight_class],
+                                          VARIATE_BLOCK_SIZE).tolist())
+        return buffer.pop()
+
+    def next_service_time(flight_class: int) -> float:
+        """
+        Take the next nonnegative, normally distributed service time for a
+        flight class.
+        :param flight_class: The flight class of the server.
+        :return: A random variate from the normal distribution (bounded by
+        0 <= x).
+        """
+        buffer = service_buffers[flight_class]
+        while not buffer:
+            variates = rng.normal(service_means[flight_class],
+                                  service_stds[flight_class],
+                                  VARIATE_BLOCK_SIZE)
+            buffer.extend(variates[variates >= 0].tolist())
+        return buffer.pop()
 
     # Initialize FEL with first arrival.
-    first_class_event = Arrival(id=get_uuid(), entity=FIRST_CLASS, time=0.0)
-    economy_class_event = Arrival(id=get_uuid(), entity=ECONOMY_CLASS, time=0.0)
+    first_class_event = Arrival(id=next_uuid(), entity=FIRST_CLASS,
+                                time=0.0)
+    economy_class_event = Arrival(id=next_uuid(), entity=ECONOMY_CLASS,
+                                  time=0.0)
     end_event = End(time=end_time)
     fel.clear()
     fel.insert_with_priority(first_class_event)
     fel.insert_with_priority(economy_class_event)
     fel.insert_with_priority(end_event)
-    previous_event = economy_class_event
+    previous_clock = 0.0
 
-    def schedule_arrival(flight_class: str,
+    def schedule_arrival(flight_class: int,
                          clock_: Union[int, float]) -> float:
         """
         Schedule an Arrival event onto the FEL.
@@ -104,17 +257,15 @@ def airport_check_in(trial: int,
         :param clock_: The current simulation time.
         :return: The randomly generated interarrival time.
         """
-        interarrival_time_ = rvg.exponential(
-            parameters[flight_class]["interarrival_mean"]
-        )
-        event = Arrival(id=get_uuid(),
+        interarrival_time_ = next_interarrival_time(flight_class)
+        event = Arrival(id=next_uuid(),
                         entity=flight_class,
                         time=clock_ + interarrival_time_)
         fel.insert_with_priority(event)
         return interarrival_time_
 
     def schedule_departure(arrival_event_: Arrival,
-                           flight_class: str,
+                           flight_class: int,
                            clock_: Union[int, float]) -> float:
         """
         Schedule a Departure event onto the FEL.
@@ -123,11 +274,7 @@ def airport_check_in(trial: int,
         :param clock_: The current simulation time.
         :return: The randomly generated service time.
         """
-        service_time_ = rvg.truncated_normal(
-            parameters[flight_class]["service_mean"],
-            parameters[flight_class]["service_std"],
-            a=0,
-        )
+        service_time_ = next_service_time(flight_class)
         event = Departure(id=arrival_event_.id,
                           entity=flight_class,
                           time=clock_ + service_time_,
@@ -136,170 +283,148 @@ def airport_check_in(trial: int,
         fel.insert_with_priority(event)
         return service_time_
 
-    # Main loop; process events until end event occurs.
-    while previous_event.type is not END:
-        current_event = fel.get_next()
-        clock = current_event.time
+    def handle_arrival_event(arrival_event_: Arrival) -> None:
+        """
+        Handles the logic for Arrival events.
+        :param arrival_event_: The Arrival event being processed.
+        :return:
+        """
+        clock_ = arrival_event_.time
+        flight_class = arrival_event_.entity
+        row = stats[flight_class]
+
+        if server_busy[flight_class]:
+            queues[flight_class].append(arrival_event_)
+            row[CURRENT_QUEUE_LENGTH] += 1
+        else:
+            server_busy[flight_class] = 1
+
+            # Schedule a Departure event for this entity.
+            service_time = schedule_departure(
+                arrival_event_,
+                flight_class,
+                clock_
+            )
 
-        # Update the time which the servers are busy.
-        for flight_class in [FIRST_CLASS, ECONOMY_CLASS]:
-            if states[FIRST_CLASS]["server_status"] is BUSY:
-                time_busy = current_event.time - previous_event.time
-                statistics[flight_class]["cumulative_time_busy"] += time_busy
+            # Collect statistics.
+            row[CUMULATIVE_SERVICE_TIME] += service_time
+            row[SERVICE_STARTED_COUNT] += 1
 
-        # Save the flight class here for easier handling later.
-        flight_class = current_event.entity
+        # Regardless, schedule a new Arrival event.
+        interarrival_time = schedule_arrival(
+            flight_class,
+            clock_
+        )
 
-        # Handle arrival logic.
-        if current_event.type is ARRIVAL:
-            if states[flight_class]["server_status"] is BUSY:
-                states[flight_class]["queue"].append(current_event)
-                statistics[flight_class]["current_queue_length"] += 1
-            else:
-                states[flight_class]["server_status"] = BUSY
+        # Collect statistics.
+        row[CUMULATIVE_INTERARRIVAL_TIME] += interarrival_time
+        row[ARRIVAL_COUNT] += 1
+        if row[CURRENT_QUEUE_LENGTH] > row[MAXIMUM_QUEUE_LENGTH]:
+            row[MAXIMUM_QUEUE_LENGTH] = row[CURRENT_QUEUE_LENGTH]
 
-                # Schedule a Departure event for this entity.
+    def handle_departure_event(departure_event_: Departure) -> None:
+        """
+        Handles the logic for Departure events.
+        :param departure_event_: The Departure event being processed.
+        :return:
+        """
+        nonlocal transfer_count
+        clock_ = departure_event_.time
+        flight_class = departure_event_.entity
+        row = stats[flight_class]
+
+        # Collect statistics.
+        response_time = clock_ - departure_event_.arrival_time
+        if response_time >= long_response_threshold:
+            row[LONG_RESPONSE_COUNT] += 1
+        row[CUMULATIVE_RESPONSE_TIME] += response_time
+        row[DEPARTURE_COUNT] += 1
+
+        # Check if the queue for the current flight class is empty.
+        if not queues[flight_class]:
+            # Check if a transfer between flight classes should occur.
+            if allow_transfers and flight_class == FIRST_CLASS and \
+                    queues[ECONOMY_CLASS] and server_busy[ECONOMY_CLASS]:
+                economy_arrival_event = queues[ECONOMY_CLASS].popleft()
                 service_time = schedule_departure(
-                    current_event,
-                    flight_class,
-                    clock
+                    economy_arrival_event,
+                    FIRST_CLASS,
+                    clock_
                 )
 
                 # Collect statistics.
-                statistics[flight_class]["cumulative_service_time"] += \
-                    service_time
-                statistics[flight_class]["service_started_count"] += 1
-
-            # Regardless, schedule a new Arrival event.
-            interarrival_time = schedule_arrival(
+                stats[FIRST_CLASS, CUMULATIVE_SERVICE_TIME] += service_time
+                stats[FIRST_CLASS, SERVICE_STARTED_COUNT] += 1
+                transfer_count += 1
+            else:
+                server_busy[flight_class] = 0
+
+        # Service the next entity.
+        else:
+            # Schedule a new Departure event for the next entity.
+            arrival_event = queues[flight_class].popleft()
+            service_time = schedule_departure(
+                arrival_event,
                 flight_class,
-                clock
+                clock_
             )
 
             # Collect statistics.
-            statistics[flight_class]["cumulative_interarrival_time"] += \
-                interarrival_time
-            statistics[flight_class]["arrival_count"] += 1
-            statistics[flight_class]["maximum_queue_length"] = \
-                max(statistics[flight_class]["maximum_queue_length"],
-                    statistics[flight_class]["current_queue_length"])
-
-        # Handle departure logic.
-        elif current_event.type is DEPARTURE:
-            # Collect statistics.
-            arrival_time = current_event.arrival_time
-            response_time = clock - arrival_time
-            if response_time >= long_response_threshold:
-                statistics[flight_class]["long_response_count"] += 1
-            statistics[flight_class][
-                "cumulative_response_time"] += response_time
-            statistics[flight_class]["departure_count"] += 1
-
-            # Check if the queue for the current flight class is empty.
-            if not states[flight_class]["queue"]:
-                # Check if a transfer between flight classes should occur.
-                if allow_transfers and flight_class is FIRST_CLASS and \
-                        len(states[ECONOMY_CLASS]["queue"]) > 0 and \
-                        states[ECONOMY_CLASS]["server_status"] is BUSY:
-                    economy_arrival_event = states[ECONOMY_CLASS]["queue"].pop(
-                        0)
-                    service_time = schedule_departure(
-                        economy_arrival_event,
-                        FIRST_CLASS,
-                        clock
-                    )
-
-                    # Collect statistics.
-                    statistics[FIRST_CLASS]["cumulative_service_time"] += \
-                        service_time
-                    statistics[FIRST_CLASS]["service_started_count"] += 1
-                    transfer_count += 1
-                else:
-                    states[flight_class]["server_status"] = IDLE
-
-            # Service the next entity.
-            else:
-                # Schedule a new Departure event for the next entity.
-                arrival_event = states[flight_class]["queue"].pop(0)
-                service_time = schedule_departure(
-                    arrival_event,
-                    flight_class,
-                    clock
-                )
+            row[CURRENT_QUEUE_LENGTH] -= 1
+            row[CUMULATIVE_SERVICE_TIME] += service_time
+            row[SERVICE_STARTED_COUNT] += 1
 
-                # Collect statistics.
-                statistics[flight_class]["current_queue_length"] -= 1
-                statistics[flight_class]["cumulative_service_time"] += \
-                    service_time
-                statistics[flight_class]["service_started_count"] += 1
+    def handle_end_event(end_event_: End) -> None:
+        """
+        Handles the logic for End events.
+        :param end_event_: The End event being processed.
+        :return:
+        """
+        nonlocal ended
+        ended = True
 
-        # Save this event for later.
-        previous_event = current_event
+    # Event handlers, indexed by event type (ARRIVAL, DEPARTURE, END).
+    handlers = [handle_arrival_event, handle_departure_event, handle_end_event]
+    ended = False
 
-    # Get the total number of arrivals, departures, and remaining entities.
-    total_arrivals = sum(
-        [statistics[flight_class]["arrival_count"]
-         for flight_class in [FIRST_CLASS, ECONOMY_CLASS]]
-    )
-    total_departures = sum(
-        [statistics[flight_class]["departure_count"]
-         for flight_class in [FIRST_CLASS, ECONOMY_CLASS]]
-    )
-    total_in_system = total_arrivals - total_departures
+    # Main loop; process events until end event occurs.
+    while not ended:
+        current_event = fel.get_next()
+        clock = current_event.time
 
-    # Construct execution parameters for output.
-    for flight_class in [FIRST_CLASS, ECONOMY_CLASS]:
-        for key in parameters[flight_class]:
-            parameters[flight_class][f"{key}_time"] = \
-                parameters[flight_class].pop(key)
-    execution_parameters = dict({
-        "simulation_run_duration": end_time,
-        "transfers_allowed": "Yes" if allow_transfers else "No",
-    }, **parameters)
-
-    # Calculate statistics for output.
-    calculated_statistics = {flight_class: {
-        "number_of_arrivals": statistics[flight_class]["arrival_count"],
-        "mean_interarrival_time": statistics[flight_class][
-                                      "cumulative_interarrival_time"] /
-                                  statistics[flight_class]["arrival_count"],
-        "maximum_queue_length": statistics[flight_class][
-            "maximum_queue_length"],
-        "length_at_simulation_end": statistics[flight_class][
-            "current_queue_length"],
-        "server_utilization": statistics[flight_class]["cumulative_time_busy"] /
-                              clock,
-        "number_of_departures": statistics[flight_class]["departure_count"],
-        "mean_response_time": statistics[flight_class]
-                              ["cumulative_response_time"] /
-                              statistics[flight_class]["departure_count"],
-        "long_response_ratio": statistics[flight_class]["long_response_count"] /
-                               statistics[flight_class]["departure_count"],
-        "mean_service_time": statistics[flight_class][
-                                 "cumulative_service_time"] /
-                             statistics[flight_class]["service_started_count"],
-        "status_at_simulation_end": states[flight_class]["server_status"]
-    } for flight_class in [FIRST_CLASS, ECONOMY_CLASS]}
-    calculated_statistics[FIRST_CLASS]["economy_class_customers_served"] = \
-        transfer_count
-    calculated_statistics["total_arrivals"] = total_arrivals
-    calculated_statistics["total_departures"] = total_departures
-    calculated_statistics["total_in_system_at_simulation_end"] = total_in_system
+        # Update the time which each server is busy.
+        stats[:, CUMULATIVE_TIME_BUSY] += (clock - previous_clock) * server_busy
 
-    output = format_output(trial,
-                           "Multi-queue, multi-server - Airport Check-In",
-                           execution_parameters,
-                           calculated_statistics)
+        # Handle event logic.
+        handlers[current_event.type](current_event)
 
-    # Return the mean response times and the formatted output.
-    overall_mean_response_time = sum(
-        [statistics[flight_class]["cumulative_response_time"]
-         for flight_class in [FIRST_CLASS, ECONOMY_CLASS]]
-    ) / total_departures
-    return (calculated_statistics[FIRST_CLASS]["mean_response_time"],
-            calculated_statistics[ECONOMY_CLASS]["mean_response_time"],
-            overall_mean_response_time,
-            output)
+        # Save this event's time for later.
+        previous_clock = clock
+
+    return stats, server_busy, transfer_count, clock
+
+
+def run_trial(trial: int, scenario: int) -> Tuple[float, float, float,
+                                                  List[str]]:
+    """
+    Execute a single, reproducible trial of the Airport Check-In DES model.
+    The trial draws its variates from its own default_rng, seeded with the
+    trial index.
+    :param trial: Trial index, also used to seed the trial.
+    :param scenario: Determines whether transfers between the first-class and
+    economy-class queues are allowed or not.
+    :return: The result of airport_check_in for this trial.
+    """
+    return airport_check_in(trial, scenario, seed=trial)
+
+
+def format_value(value: Any) -> str:
+    """
+    Format a calculated statistic for output.
+    :param value: The value of the statistic.
+    :return: The value, rounded to four decimal places if it is a float.
+    """
+    return f"{value:.4f}" if isinstance(value, float) else f"{value}"
 
 
 def format_output(trial: int,
@@ -321,40 +446,32 @@ def format_output(trial: int,
     ]
 
     for flight_class in [FIRST_CLASS, ECONOMY_CLASS]:
-        for key, value in parameters[flight_class].items():
-            format_key = f"{flight_class.replace('_', ' ').capitalize()}, " \
-                         f"{key.replace('_', ' ').capitalize()}"
-            format_str = f"\t\t{format_key:<45}"
-            format_str += f"{value}"
-            if "time" in key or "duration" in key:
-                format_str += " minutes"
-            lines.append(format_str)
-    for key, value in parameters.items():
-        if not isinstance(value, dict):
-            format_str = f"\t\t{key.replace('_', ' ').capitalize():<45}"
-            format_str += f"{value}"
-            if "time" in key or "duration" in key:
-                format_str += " minutes"
-            lines.append(format_str)
+        class_name = FLIGHT_CLASS_NAMES[flight_class]
+        lines.extend(
+            f"\t\t{class_name + ', ' + PRETTY_KEYS[key]:<45}{value}"
+            f"{' minutes' if key in MINUTE_KEYS else ''}"
+            for key, value in parameters[flight_class].items()
+        )
+    lines.extend(
+        f"\t\t{PRETTY_KEYS[key]:<45}{value}"
+        f"{' minutes' if key in MINUTE_KEYS else ''}"
+        for key, value in parameters.items() if not isinstance(value, dict)
+    )
     lines.append("")
 
     lines.append("\tCalculated statistics")
     for flight_class in [FIRST_CLASS, ECONOMY_CLASS]:
-        for key, value in statistics[flight_class].items():
-            format_key = f"{flight_class.replace('_', ' ').capitalize()}, " \
-                         f"{key.replace('_', ' ').capitalize()}"
-            format_str = f"\t\t{format_key:<45}"
-            format_str += f"{value:.4f}" if isinstance(value, float) \
-                else f"{value}"
-            if "time" in key or "duration" in key:
-                format_str += " minutes"
-            lines.append(format_str)
+        class_name = FLIGHT_CLASS_NAMES[flight_class]
+        lines.extend(
+            f"\t\t{class_name + ', ' + PRETTY_KEYS[key]:<45}"
+            f"{format_value(value)}{' minutes' if key in MINUTE_KEYS else ''}"
+            for key, value in statistics[flight_class].items()
+        )
         lines.append("")
-    for key, value in statistics.items():
-        if not isinstance(value, dict):
-            format_str = f"\t\t{key.replace('_', ' ').capitalize():<45}"
-            format_str += f"{value}"
-            lines.append(format_str)
+    lines.extend(
+        f"\t\t{PRETTY_KEYS[key]:<45}{value}"
+        for key, value in statistics.items() if not isinstance(value, dict)
+    )
     lines.append("")
 
     return lines
@@ -364,35 +481,46 @@ def main():
     # Run 100 trials of the Airport Check-In DES model.
     trial_count = 100
     for scenario in [ALLOW_TRANSFERS, PROHIBIT_TRANSFERS]:
-        trials = [airport_check_in(trial_index, scenario)
-                  for trial_index in range(1, trial_count + 1)]
+        # Trials are independent, so run them in parallel.
+        with Pool() as pool:
+            trials = pool.starmap(
+                run_trial,
+                [(trial_index, scenario)
+                 for trial_index in range(1, trial_count + 1)]
+            )
 
         # Write the results of each trial to an output file.
         # Also, write the mean response times from all trials to the file.
+        scenario_name = SCENARIO_NAMES[scenario]
         mean_responses = {
-            FIRST_CLASS: [],
-            ECONOMY_CLASS: [],
-            "overall": []
+            FLIGHT_CLASS_NAMES[FIRST_CLASS]: [],
+            FLIGHT_CLASS_NAMES[ECONOMY_CLASS]: [],
+            "Overall": []
         }
         with open(f"{OUTPUT_DIRECTORY}airport_check_in_"
-                  f"{scenario.lower()}_transfers.txt", "w") as fp:
+                  f"{scenario_name.lower()}_transfers.txt", "w") as fp:
             for first_response, economy_response, overall_response, \
                 output in trials:
-                for lines in output:
-                    fp.writelines(lines + "\n")
-                mean_responses[FIRST_CLASS].append(first_response)
-                mean_responses[ECONOMY_CLASS].append(economy_response)
-                mean_responses["overall"].append(overall_response)
-            fp.write(f"Airport Check-In, scenario= {scenario.capitalize()} "
-                     f"trials= {trial_count}\n")
-            transfers_allowed = "Yes" if scenario is ALLOW_TRANSFERS else "No"
-            fp.write(f"\t{'Transfers allowed':<40}{transfers_allowed}\n")
+                fp.write("\n".join(output))
+                fp.write("\n")
+                mean_responses[FLIGHT_CLASS_NAMES[FIRST_CLASS]].append(
+                    first_response)
+                mean_responses[FLIGHT_CLASS_NAMES[ECONOMY_CLASS]].append(
+                    economy_response)
+                mean_responses["Overall"].append(overall_response)
+            transfers_allowed = "Yes" if scenario == ALLOW_TRANSFERS else "No"
+            summary_lines = [
+                f"Airport Check-In, scenario= {scenario_name.capitalize()} "
+                f"trials= {trial_count}",
+                f"\t{'Transfers allowed':<40}{transfers_allowed}",
+            ]
             for key, response_times in mean_responses.items():
                 mean_response_time = sum(response_times) / trial_count
-                format_key = f"{key.replace('_', ' ').capitalize()}, " \
-                             f"mean of mean responses="
-                fp.write(f"\t{format_key:<40}")
-                fp.write(f"{mean_response_time:.4f}\n")
+                format_key = f"{key}, mean of mean responses="
+                summary_lines.append(
+                    f"\t{format_key:<40}{mean_response_time:.4f}")
+            fp.write("\n".join(summary_lines))
+            fp.write("\n")
 
 
 if __name__ == "__main__":
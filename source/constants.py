@@ -4,14 +4,56 @@
 # Description: This file contains constant values for all programs in CS 581.
 
 # Python Imports
-import os
+from pathlib import Path
+
+# These are the constants exported by "from source.constants import *".
+__all__ = [
+    # Directory Constants
+    'SOURCE_DIRECTORY',
+    'ROOT_DIRECTORY',
+    'OUTPUT_DIRECTORY',
+    'CFA_DIRECTORY',
+    'CFA_DATA',
+    'CFA_FIGURE_DIRECTORY',
+    'CFA_TIMESTAMPS_FILE',
+    'CFA_STATISTICS_FILE',
+    # Event Constants
+    'ARRIVAL',
+    'DEPARTURE',
+    'END',
+    'ALQ',
+    'EL',
+    'EW',
+    'TRAVEL',
+    'EVENT_NAMES',
+    # Entity Constants
+    'IDLE',
+    'BUSY',
+    'DUMP_TRUCK',
+    # DES Model Specific Constants
+    'ALLOW_TRANSFERS',
+    'PROHIBIT_TRANSFERS',
+    'SCENARIO_NAMES',
+    'FIRST_CLASS',
+    'ECONOMY_CLASS',
+    'FLIGHT_CLASS_NAMES',
+    'STATISTICS_HEADERS',
+    # Heap Implementation Constants
+    'CUSTOM_HEAP',
+    'PYTHON_HEAP',
+    'CALENDAR_QUEUE',
+    # Test Constants
+    'LOG_FILE',
+]
 
 # ------------------------------------------------------------------------------
 # Directory Constants
 # ------------------------------------------------------------------------------
-SOURCE_DIRECTORY = os.getcwd() + "/"
-ROOT_DIRECTORY = os.path.abspath(os.path.join(SOURCE_DIRECTORY, os.pardir)) + \
-                 "/"
+# Directories are found relative to this file rather than the current working
+# directory, so they stay valid wherever the programs are run from.
+_MODULE_PATH = Path(__file__).resolve()
+SOURCE_DIRECTORY = f"{_MODULE_PATH.parent}/"
+ROOT_DIRECTORY = f"{_MODULE_PATH.parent.parent}/"
 OUTPUT_DIRECTORY = ROOT_DIRECTORY + "output/"
 
 # CFA Directories
@@ -26,15 +68,17 @@ CFA_STATISTICS_FILE = CFA_DATA + "cv_cfa_statistics.csv"
 # ------------------------------------------------------------------------------
 # Event Constants
 # ------------------------------------------------------------------------------
-ARRIVAL = "ARRIVAL"
-DEPARTURE = "DEPARTURE"
+# Event types are small integers; EVENT_NAMES maps them back for printing.
+ARRIVAL = 0
+DEPARTURE = 1
+END = 2
 
-ALQ = "ALQ"
-EL = "EL"
-EW = "EW"
+ALQ = 3
+EL = 4
+EW = 5
 TRAVEL = "Travel"
 
-END = "END"
+EVENT_NAMES = ("ARRIVAL", "DEPARTURE", "END", "ALQ", "EL", "EW")
 
 # ------------------------------------------------------------------------------
 # Entity Constants
@@ -47,11 +91,14 @@ DUMP_TRUCK = "DUMP_TRUCK"
 # ------------------------------------------------------------------------------
 # DES Model Specific Constants
 # ------------------------------------------------------------------------------
-# Grocery Check-In
-ALLOW_TRANSFERS = "ALLOW"
-PROHIBIT_TRANSFERS = "PROHIBIT"
-FIRST_CLASS = "FIRST_CLASS"
-ECONOMY_CLASS = "ECONOMY"
+# Airport Check-In
+ALLOW_TRANSFERS = 0
+PROHIBIT_TRANSFERS = 1
+SCENARIO_NAMES = ("ALLOW", "PROHIBIT")
+
+FIRST_CLASS = 0
+ECONOMY_CLASS = 1
+FLIGHT_CLASS_NAMES = ("First class", "Economy")
 
 # Charger Village CFA
 STATISTICS_HEADERS = [
@@ -69,6 +116,7 @@ STATISTICS_HEADERS = [
 # ------------------------------------------------------------------------------
 CUSTOM_HEAP = "Custom Min Heap"
 PYTHON_HEAP = "heapq Min Heap"
+CALENDAR_QUEUE = "Calendar Queue"
 
 # ------------------------------------------------------------------------------
 # Test Constants
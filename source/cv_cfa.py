@@ -5,6 +5,7 @@
 #              Charger Village Chick-Fil-A DES model.
 
 # Python Imports
+import math
 from typing import Any, Dict, List, Tuple
 
 # Third-Party Imports
@@ -28,49 +29,41 @@ def output_statistics_file() -> None:
     for column in times_df.columns:
         times_df[column] = pd.to_datetime(times_df[column])
 
-    # Populate the statistics dataframe with timedeltas.
-    stats_df = pd.DataFrame(columns=STATISTICS_HEADERS)
-    stats_df["interarrival_time"] = times_df["arrival_time"].diff()
-
-    stats_df["response_rate"] = times_df["cashier_service_end_time"] - \
-                                times_df["arrival_time"]
-
-    stats_df["cashier_service_time"] = times_df["cashier_service_end_time"] - \
-                                       times_df["cashier_service_start_time"]
-
-    stats_df["counter_service_time"] = times_df["counter_service_end_time"] - \
-                                       times_df["counter_service_start_time"]
-
-    stats_df["food_delay"] = times_df["food_delay_end_time"] - \
-                             times_df["food_delay_start_time"]
+    # Get every timestamp column as a NumPy datetime array; missing
+    # timestamps become NaT, so the durations computed from them become nan.
+    times = {column: times_df[column].to_numpy(dtype="datetime64[ns]")
+             for column in times_df.columns}
 
-    stats_df["drink_delay"] = times_df["cashier_service_start_time"] - \
-                              times_df["cashier_arrival_time"]
-
-    stats_df["enter_queue_delay"] = times_df["front_of_queue_time"] - \
-                                    times_df["arrival_time"]
-
-
-    def strfdelta(td: pd.Timedelta) -> str:
+    def minutes_between(start: str, end: str) -> np.ndarray:
         """
-        Represent timedelta objects in minutes.
-        :param td: The candidate timedelta.
-        :return: The timedelta in minutes, rounded to four decimal places.
+        Compute the time between two timestamp columns in minutes.
+        :param start: The name of the column of start timestamps.
+        :param end: The name of the column of end timestamps.
+        :return: The elapsed times in minutes, for every row.
         """
-        minutes = td.seconds / 60
-        return f"{minutes:.4f}"
+        return (times[end] - times[start]) / np.timedelta64(1, "m")
 
-
-    # Format the timedelta objects to use minutes as the time unit.
-    for column in stats_df.columns:
-        try:
-            stats_df[column] = stats_df[column].apply(strfdelta)
-        # If the entry is nan, skip it.
-        except:
-            pass
+    # Populate the statistics dataframe with durations in minutes.
+    stats_df = pd.DataFrame(columns=STATISTICS_HEADERS)
+    stats_df["interarrival_time"] = np.concatenate(
+        ([np.nan], np.diff(times["arrival_time"]) / np.timedelta64(1, "m"))
+    )
+    stats_df["response_rate"] = minutes_between("arrival_time",
+                                                "cashier_service_end_time")
+    stats_df["cashier_service_time"] = minutes_between(
+        "cashier_service_start_time", "cashier_service_end_time")
+    stats_df["counter_service_time"] = minutes_between(
+        "counter_service_start_time", "counter_service_end_time")
+    stats_df["food_delay"] = minutes_between("food_delay_start_time",
+                                             "food_delay_end_time")
+    stats_df["drink_delay"] = minutes_between("cashier_arrival_time",
+                                              "cashier_service_start_time")
+    stats_df["enter_queue_delay"] = minutes_between("arrival_time",
+                                                    "front_of_queue_time")
 
     # Output the finalized statistics file to the data directory.
-    stats_df.to_csv(CFA_STATISTICS_FILE, index=False)
+    stats_df.to_csv(CFA_STATISTICS_FILE, index=False, float_format="%.4f",
+                    na_rep="nan")
 
 
 def plot_histograms(stats_df: pd.DataFrame) -> None:
@@ -79,14 +72,30 @@ def plot_histograms(stats_df: pd.DataFrame) -> None:
     :param stats_df: The dataframe of statistics.
     :return:
     """
-    for column in stats_df.columns:
-        plt.clf()
-        stats_df.hist(column=column, figsize=(10, 8))
-        plt.xlabel("Time (minutes)")
-        plt.ylabel("Frequency")
-        plt.tight_layout()
-        plt.savefig(f"{CFA_FIGURE_DIRECTORY}{column}_histogram.png")
+    # Plot every histogram onto one figure, three to a row.
+    column_count = len(stats_df.columns)
+    row_count = math.ceil(column_count / 3)
+    fig, axes = plt.subplots(row_count, 3, figsize=(15, 4 * row_count))
+    axes = axes.ravel()
+    stats_df.hist(ax=axes[:column_count])
+    for ax in axes[:column_count]:
+        ax.set_xlabel("Time (minutes)")
+        ax.set_ylabel("Frequency")
+    for ax in axes[column_count:]:
+        ax.set_visible(False)
+    fig.tight_layout()
+    fig.savefig(f"{CFA_FIGURE_DIRECTORY}statistics_histograms.png")
+
+    # Also save each histogram on its own by cropping the figure to its axes.
+    renderer = fig.canvas.get_renderer()
+    for column, ax in zip(stats_df.columns, axes):
+        bbox = ax.get_tightbbox(renderer).transformed(
+            fig.dpi_scale_trans.inverted())
+        fig.savefig(f"{CFA_FIGURE_DIRECTORY}{column}_histogram.png",
+                    bbox_inches=bbox)
+    if plt.isinteractive():
         plt.show()
+    plt.close(fig)
 
 
 def main() -> None:
@@ -5,10 +5,16 @@
 #              Dump Truck Operation DES model.
 
 # Python Imports
+from bisect import bisect_left
+from collections import deque
+from itertools import accumulate
+from multiprocessing import Pool
+import random
 from typing import Any, Dict, List, Tuple
 
 # Third-Party Imports
 from matplotlib import pyplot as plt
+from matplotlib.collections import LineCollection
 import numpy as np
 import pandas as pd
 
@@ -16,14 +22,15 @@ import pandas as pd
 from source.constants import *
 from source.events import ArrivalLoadingQueue, EndLoading, EndWeighing, End
 import source.future_event_list as fel
-import source.random_variate_generators as rvg
 
 
 def dump_truck_operation(trial: int,
                          variates: Dict[str, int],
                          probabilities: Dict[str, float],
                          truck_count: int = 8,
-                         end_time: int = 240) -> Tuple[float, float, List[str]]:
+                         end_time: int = 240,
+                         seed: int = None) -> Tuple[float, float, List[str],
+                                                    pd.DataFrame]:
     """
     Run a single trial of the Dump Truck Operation DES model.
     :param trial: The index of the current trial.
@@ -31,119 +38,100 @@ def dump_truck_operation(trial: int,
     :param probabilities: The corresponding probabilities for those events.
     :param truck_count: The number of trucks for the simulation.
     :param end_time: The simulation end time.
-    :return: A tuple containing the loader and scale utilization ratios, as
-    well as the output for the trial.
+    :param seed: Seed for this trial's random number generator.
+    :return: A tuple containing the loader and scale utilization ratios, the
+    output for the trial, and the dataframe of system states.
     """
-    # Keep some statistics of the simulation.
-    statistics = {
-        "total_busy_loaders": 0,
-        "total_busy_scale": 0,
-    }
+    # Precompute the cumulative probabilities of each empirical distribution.
+    # The last entry is left out, so a random number can never index past
+    # the final variate.
+    cdfs = {key: list(accumulate(probabilities[key]))[:-1]
+            for key in [EL, EW, TRAVEL]}
 
-    # Maintain queues for the loaders and scale.
-    queue = {
-        "L": [],
-        "W": []
-    }
+    total_busy_loaders, total_busy_scale, rows = run_simulation(
+        variates, cdfs, truck_count, end_time, seed)
 
-    # Maintain a dataframe for the system states.
+    # Build the dataframe of system states in one go.
     header = ["clock", "LQ", "L", "WQ", "W", TRAVEL]
-    state = {col: 0 for col in header}
-    state[TRAVEL] = truck_count
-    states = pd.DataFrame(columns=header)
-    states.loc[len(states)] = state
+    states = pd.DataFrame(rows, columns=header)
 
-    def get_travel_count() -> int:
-        """
-        Calculate the number of trucks travelling outside the system.
-        :return: The number of trucks travelling outside the system.
-        """
-        trucks_in_system = state["LQ"] + state["L"] + state["WQ"] + state["W"]
-        return truck_count - trucks_in_system
+    # Get the utilization ratios for this trial.
+    loader_utilization = total_busy_loaders / (2 * end_time)
+    scale_utilization = total_busy_scale / end_time
 
-    def handle_alq_event(dump_truck_index: int) -> None:
-        """
-        Handles the logic for ArrivalLoadingQueue (ALQ) events.
-        :param dump_truck_index: The index for the dump truck entity.
-        :return:
-        """
-        # Check if there is an idle loader available.
-        if state["L"] < 2:
-            # Schedule an EndLoading event for this dump truck.
-            state["L"] += 1
-            service_time = rvg.empirical(variates[EL], probabilities[EL])
-            event = EndLoading(id=dump_truck_index,
-                               time=state["clock"] + service_time
-                               )
-            fel.insert_with_priority(event)
-        # If no idle loader, then put this dump truck on the loading queue.
-        else:
-            state["LQ"] += 1
-            queue["L"].append(dump_truck_index)
-
-    def handle_el_event(dump_truck_index: int) -> None:
-        """
-        Handles the logic for EndLoading (EL) events.
-        :param dump_truck_index: The index for the dump truck entity.
-        :return:
-        """
-        state["L"] -= 1  # Loading finished, make one loader available.
-
-        # Check if the scale is available.
-        if state["W"] == 0:
-            # Schedule an EndWeighing event for this dump truck.
-            state["W"] = 1
-            service_time = rvg.empirical(variates[EW], probabilities[EW])
-            event = EndWeighing(id=dump_truck_index,
-                                time=state["clock"] + service_time
-                                )
-            fel.insert_with_priority(event)
-        # If unavailable, then put this dump truck on the weighing queue.
-        else:
-            state["WQ"] += 1
-            queue["W"].append(dump_truck_index)
-
-        # Check if there are any dump trucks in the loading queue.
-        if state["LQ"] > 0:
-            # Take the first dump truck from the queue and schedule
-            # an EndLoading event for it.
-            next_dump_truck_index = queue["L"].pop(0)
-            state["LQ"] -= 1
-            state["L"] += 1
-            service_time = rvg.empirical(variates[EL],
-                                         probabilities[EL])
-            event = EndLoading(id=next_dump_truck_index,
-                               time=state["clock"] + service_time
-                               )
-            fel.insert_with_priority(event)
-
-    def handle_ew_event(dump_truck_index: int) -> None:
-        """
-        Handles the logic for EndWeighing (EW) events.
-        :param dump_truck_index: The index for the dump truck entity.
-        :return:
-        """
-        state["W"] = 0  # Weighing finished, make the scale available.
+    # Produce output of the trial.
+    execution_parameters = {
+        "scenario": "2 Notional",
+        "simulation_run_length": end_time,
+        "number_trucks": truck_count,
+    }
+    calculated_statistics = {
+        "loader_utilization": loader_utilization,
+        "scale_utilization": scale_utilization,
+    }
+    output = format_output(trial,
+                           "Multi-queue, multi-server - Dump Truck Operation",
+                           execution_parameters,
+                           calculated_statistics)
+    return loader_utilization, scale_utilization, output, states
 
-        # Send this dump truck to travel for some time in the system.
-        delay = rvg.empirical(variates[TRAVEL], probabilities[TRAVEL])
-        event = ArrivalLoadingQueue(id=dump_truck_index,
-                                    time=state["clock"] + delay
-                                    )
-        fel.insert_with_priority(event)
 
-        # Check if there are any dump trucks in the weighing queue.
-        if state["WQ"] > 0:
-            # Take the first dump truck from the queue and schedule
-            # an EndWeighing event for it.
-            next_dump_truck_index = queue["W"].pop(0)
-            state["WQ"] -= 1
-            state["W"] = 1
-            service_time = rvg.empirical(variates[EW], probabilities[EW])
-            event = EndWeighing(id=next_dump_truck_index,
-                                time=state["clock"] + service_time
-                                )
-            fel.insert_with_priority(event)
+def run_trial(trial: int,
+              variates: Dict[str, List[int]],
+              probabilities: Dict[str, List[float]],
+              truck_count: int,
+              end_time: int) -> Tuple[float, float, List[str], pd.DataFrame]:
+    """
+    Execute a single, reproducible trial of the Dump Truck Operation DES
+    model. The trial samples its variates from its own random.Random, seeded
+    with the trial index.
+    :param trial: Trial index, also used to seed the trial.
+    :param variates: The variates for all three kinds of events.
+    :param probabilities: The corresponding probabilities for those events.
+    :param truck_count: The number of trucks for the simulation.
+    :param end_time: The simulation end time.
+    :return: The result of dump_truck_operation for this trial.
+    """
+    return dump_truck_operation(trial, variates, probabilities, truck_count,
+                                end_time, seed=trial)
+
+
+def run_simulation(variates: Dict[str, List[int]],
+                   cdfs: Dict[str, List[float]],
+                   truck_count: int,
+                   end_time: int,
+                   seed: int = None) -> Tuple[int, int, np.ndarray]:
+    """
+    Run the event loop of the Dump Truck Operation DES model, recording the
+    system state after every event.
+    :param variates: The (positive, integer) variates for all three kinds of
+    events.
+    :param cdfs: The cumulative probabilities of those variates, without
+    the final entry.
+    :param truck_count: The number of trucks for the simulation.
+    :param end_time: The simulation end time.
+    :param seed: Seed for this trial's random number generator.
+    :return: A tuple of the total busy time of the loaders and the scale, and
+    an array of the system state (clock, LQ, L, WQ, W, travelling) after
+    every event.
+    """
+    # Keep some statistics of the simulation.
+    total_busy_loaders = 0
+    total_busy_scale = 0
+
+    # Track the system state in a context shared with the event handlers.
+    ctx = TrialContext(variates, cdfs, seed)
+
+    # Record the system state after every event in a preallocated array.
+    # A truck processes three events per cycle, and no cycle can be shorter
+    # than the shortest loading, weighing, and travel times combined, which
+    # bounds the number of events before the simulation ends.
+    shortest_cycle = max(sum(min(variates[key]) for key in [EL, EW, TRAVEL]),
+                         1)
+    max_events = 3 * truck_count * (end_time // shortest_cycle + 1)
+    rows = np.empty((max_events + 1, 6), dtype=np.int32)
+    rows[0] = (0, 0, 0, 0, 0, truck_count)
+    row_count = 1
 
     # Initialize the FEL with the dump trucks.
     fel.clear()
@@ -151,58 +139,169 @@ def dump_truck_operation(trial: int,
         fel.insert_with_priority(ArrivalLoadingQueue(id=index + 1, time=index))
     fel.insert_with_priority(End(time=end_time))
 
+    # Map each event type to its handler; End events stop the simulation.
+    handlers = {
+        ALQ: handle_alq_event,
+        EL: handle_el_event,
+        EW: handle_ew_event,
+    }
+
     # Enter the main loop of the simulation.
-    previous_event = ArrivalLoadingQueue(id=truck_count, time=0)
     while True:
         current_event = fel.get_next()
 
         # Collect statistics.
-        delta_time = current_event.time - previous_event.time
-        state["clock"] = current_event.time
-        statistics["total_busy_loaders"] += delta_time * state["L"]
-        statistics["total_busy_scale"] += delta_time * state["W"]
+        delta_time = current_event.time - ctx.clock
+        ctx.clock = current_event.time
+        total_busy_loaders += delta_time * ctx.L
+        total_busy_scale += delta_time * ctx.W
 
         # Handle event logic.
-        if current_event.type is ALQ:
-            handle_alq_event(current_event.id)
-        elif current_event.type is EL:
-            handle_el_event(current_event.id)
-        elif current_event.type is EW:
-            handle_ew_event(current_event.id)
-        elif current_event.type is END:
+        if current_event.type == END:
             break
-        else:
+        handler = handlers.get(current_event.type)
+        if handler is None:
             print("ERROR: Reached impossible state.")
             exit(1)
+        handler(ctx, current_event.id)
 
-        # Save the current state and the previous event.
-        state[TRAVEL] = get_travel_count()
-        states.loc[len(states)] = state
-        previous_event = current_event
+        # Save the current state; the remaining trucks are travelling.
+        in_system = ctx.LQ + ctx.L + ctx.WQ + ctx.W
+        rows[row_count] = (ctx.clock, ctx.LQ, ctx.L, ctx.WQ, ctx.W,
+                           truck_count - in_system)
+        row_count += 1
 
-    # Get the utilization ratios for this trial.
-    loader_utilization = statistics["total_busy_loaders"] / (2 * end_time)
-    scale_utilization = statistics["total_busy_scale"] / end_time
+    return total_busy_loaders, total_busy_scale, rows[:row_count]
 
-    # Plot only the first trial.
-    if trial == 1:
-        plot_states(states, truck_count, end_time)
 
-    # Produce output of the trial.
-    execution_parameters = {
-        "scenario": "2 Notional",
-        "simulation_run_length": end_time,
-        "number_trucks": truck_count,
-    }
-    calculated_statistics = {
-        "loader_utilization": loader_utilization,
-        "scale_utilization": scale_utilization,
-    }
-    output = format_output(trial,
-                           "Multi-queue, multi-server - Dump Truck Operation",
-                           execution_parameters,
-                           calculated_statistics)
-    return loader_utilization, scale_utilization, output
+class TrialContext:
+    """
+    The state of a single Dump Truck Operation trial: the clock, the loading
+    queue (LQ), the busy loaders (L), the weighing queue (WQ), and the busy
+    scale (W), along with the distributions to sample from and the trial's
+    own random number generator.
+    """
+    __slots__ = ("clock", "LQ", "L", "WQ", "W", "loading_queue",
+                 "weighing_queue", "variates", "cdfs", "rng")
+
+    def __init__(self, variates: Dict[str, List[int]],
+                 cdfs: Dict[str, List[float]],
+                 seed: int = None):
+        """
+        :param variates: The variates for all three kinds of events.
+        :param cdfs: The cumulative probabilities of those variates, without
+        the final entry.
+        :param seed: Seed for the trial's random number generator.
+        """
+        self.clock = 0
+        self.LQ = 0
+        self.L = 0
+        self.WQ = 0
+        self.W = 0
+        self.loading_queue = deque()
+        self.weighing_queue = deque()
+        self.variates = variates
+        self.cdfs = cdfs
+        self.rng = random.Random(seed)
+
+
+def sample(ctx: TrialContext, key: str) -> int:
+    """
+    Generate a random variate from one of the empirical distributions.
+    :param ctx: The state of the current trial.
+    :param key: The kind of event (EL, EW, or TRAVEL) to sample for.
+    :return: A random variate from that event's empirical distribution.
+    """
+    return ctx.variates[key][bisect_left(ctx.cdfs[key], ctx.rng.random())]
+
+
+def handle_alq_event(ctx: TrialContext, dump_truck_index: int) -> None:
+    """
+    Handles the logic for ArrivalLoadingQueue (ALQ) events.
+    :param ctx: The state of the current trial.
+    :param dump_truck_index: The index for the dump truck entity.
+    :return:
+    """
+    # Check if there is an idle loader available.
+    if ctx.L < 2:
+        # Schedule an EndLoading event for this dump truck.
+        ctx.L += 1
+        service_time = sample(ctx, EL)
+        event = EndLoading(id=dump_truck_index,
+                           time=ctx.clock + service_time
+                           )
+        fel.insert_with_priority(event)
+    # If no idle loader, then put this dump truck on the loading queue.
+    else:
+        ctx.LQ += 1
+        ctx.loading_queue.append(dump_truck_index)
+
+
+def handle_el_event(ctx: TrialContext, dump_truck_index: int) -> None:
+    """
+    Handles the logic for EndLoading (EL) events.
+    :param ctx: The state of the current trial.
+    :param dump_truck_index: The index for the dump truck entity.
+    :return:
+    """
+    ctx.L -= 1  # Loading finished, make one loader available.
+
+    # Check if the scale is available.
+    if ctx.W == 0:
+        # Schedule an EndWeighing event for this dump truck.
+        ctx.W = 1
+        service_time = sample(ctx, EW)
+        event = EndWeighing(id=dump_truck_index,
+                            time=ctx.clock + service_time
+                            )
+        fel.insert_with_priority(event)
+    # If unavailable, then put this dump truck on the weighing queue.
+    else:
+        ctx.WQ += 1
+        ctx.weighing_queue.append(dump_truck_index)
+
+    # Check if there are any dump trucks in the loading queue.
+    if ctx.LQ > 0:
+        # Take the first dump truck from the queue and schedule
+        # an EndLoading event for it.
+        next_dump_truck_index = ctx.loading_queue.popleft()
+        ctx.LQ -= 1
+        ctx.L += 1
+        service_time = sample(ctx, EL)
+        event = EndLoading(id=next_dump_truck_index,
+                           time=ctx.clock + service_time
+                           )
+        fel.insert_with_priority(event)
+
+
+def handle_ew_event(ctx: TrialContext, dump_truck_index: int) -> None:
+    """
+    Handles the logic for EndWeighing (EW) events.
+    :param ctx: The state of the current trial.
+    :param dump_truck_index: The index for the dump truck entity.
+    :return:
+    """
+    ctx.W = 0  # Weighing finished, make the scale available.
+
+    # Send this dump truck to travel for some time in the system.
+    delay = sample(ctx, TRAVEL)
+    event = ArrivalLoadingQueue(id=dump_truck_index,
+                                time=ctx.clock + delay
+                                )
+    fel.insert_with_priority(event)
+
+    # Check if there are any dump trucks in the weighing queue.
+    if ctx.WQ > 0:
+        # Take the first dump truck from the queue and schedule
+        # an EndWeighing event for it.
+        next_dump_truck_index = ctx.weighing_queue.popleft()
+        ctx.WQ -= 1
+        ctx.W = 1
+        service_time = sample(ctx, EW)
+        event = EndWeighing(id=next_dump_truck_index,
+                            time=ctx.clock + service_time
+                            )
+        fel.insert_with_priority(event)
 
 
 def plot_states(states: pd.DataFrame,
@@ -229,9 +328,19 @@ def plot_states(states: pd.DataFrame,
     plt.yticks([truck for truck in range(truck_count + 1)])
     plt.margins(x=5, y=0.3)
 
-    # Plot the dashed, gray vertical lines representing each event start.
-    for clock in states["clock"].values:
-        plt.axvline(clock, alpha=0.3, ls="--", color="gray")
+    # Plot the dashed, gray vertical lines representing each event start as
+    # a single collection. Like axvline, the segments span the full height
+    # of the axes.
+    clocks = states["clock"].values
+    segments = np.stack([
+        np.column_stack([clocks, np.zeros(len(clocks))]),
+        np.column_stack([clocks, np.ones(len(clocks))]),
+    ], axis=1)
+    axes = plt.gca()
+    axes.add_collection(LineCollection(segments,
+                                       transform=axes.get_xaxis_transform(),
+                                       alpha=0.3, linestyles="--",
+                                       colors="gray"))
 
     # Plot the differing system states for each truck over time.
     plot_offsets_x = np.array([-2, -1, 0, 1, 2]) * 0.25
@@ -298,26 +407,40 @@ def main():
         TRAVEL: [0.4, 0.3, 0.2, 0.1],
     }
 
-    # Run 100 trials of the Airport Check-In DES model.
+    # Run 100 trials of the Dump Truck Operation DES model. Trials are
+    # independent, so run them in parallel.
     trial_count = 100
-    trials = [dump_truck_operation(trial_index, variates, probabilities)
-              for trial_index in range(1, trial_count + 1)]
-
-    # Output all trials of the simulation, as well as the mean utilizations.
+    truck_count = 8
+    end_time = 240
+    with Pool() as pool:
+        trials = pool.starmap(
+            run_trial,
+            [(trial_index, variates, probabilities, truck_count, end_time)
+             for trial_index in range(1, trial_count + 1)]
+        )
+
+    # Plot only the first trial; plotting stays in the main process.
+    plot_states(trials[0][3], truck_count, end_time)
+
+    # Output all trials of the simulation, as well as the mean utilizations,
+    # with a single write.
+    lines = []
+    loader_total = 0.0
+    scale_total = 0.0
+    for loader_utilization, scale_utilization, output, _ in trials:
+        loader_total += loader_utilization
+        scale_total += scale_utilization
+        lines.extend(output)
+    loader_average = loader_total / len(trials)
+    scale_average = scale_total / len(trials)
+    lines.extend([
+        f"Dump Truck Operation, scenario= 2 trials= {trial_count}",
+        f"\tMean loader utilization= {loader_average:.4f}",
+        f"\tMean scale utilization= {scale_average:.4f}",
+    ])
     with open(f"{OUTPUT_DIRECTORY}dump_truck_operation.txt", "w") as fp:
-        loader_utilizations = []
-        scale_utilizations = []
-        for loader_utilization, scale_utilization, output in trials:
-            loader_utilizations.append(loader_utilization)
-            scale_utilizations.append(scale_utilization)
-            for lines in output:
-                fp.writelines(lines + "\n")
-        fp.write(f"Dump Truck Operation, scenario= 2 "
-                 f"trials= {trial_count}\n")
-        loader_average = sum(loader_utilizations) / len(loader_utilizations)
-        scale_average = sum(scale_utilizations) / len(scale_utilizations)
-        fp.write(f"\tMean loader utilization= {loader_average:.4f}\n")
-        fp.write(f"\tMean scale utilization= {scale_average:.4f}\n")
+        fp.write("\n".join(lines))
+        fp.write("\n")
 
 
 if __name__ == "__main__":
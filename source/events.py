@@ -7,11 +7,32 @@
 from typing import Union
 
 # Custom Imports
-from source.constants import ARRIVAL, DEPARTURE, END, ALQ, EL, EW
+from source.constants import ARRIVAL, DEPARTURE, END, ALQ, EL, EW, \
+    EVENT_NAMES
+
+
+# Priorities of Events occurring at the same time, by type; lower goes first,
+# so the order is Arrival > Departure > End. The FEL returns Events with the
+# same time and priority (e.g., EL and EW) in insertion order.
+_TYPE_PRIO = {
+    ARRIVAL: 0,
+    ALQ: 0,
+    DEPARTURE: 1,
+    EL: 1,
+    EW: 1,
+    END: 2,
+}
 
 
 class Event:
     """Base Event class."""
+    # Use fixed attribute slots instead of a per-instance __dict__. The type
+    # is shared by every Event of a class, so it is a class attribute.
+    __slots__ = ("id", "entity", "time", "arrival_time", "cancelled")
+    type = None
+    # Priority among Events occurring at the same time; see _TYPE_PRIO.
+    _prio = 1
+
     def __init__(self, id: int = None, entity: str = None,
                  time: Union[int, float] = 0):
         """
@@ -22,8 +43,8 @@ class Event:
         self.id = id
         self.entity = entity
         self.time = time
-        self.type = None
         self.arrival_time = None
+        self.cancelled = False  # Cancelled Events are skipped by the FEL.
 
     def __lt__(self, other: "Event") -> bool:
         """
@@ -33,11 +54,7 @@ class Event:
                  If Events occur at the same time, the priority is as follows:
                  Arrival > Departure > End.
         """
-        if self.time == other.time:
-            if self.type == END:
-                return False
-            return self.type == ALQ
-        return self.time < other.time
+        return (self.time, self._prio) < (other.time, other._prio)
 
     def __eq__(self, other: "Event") -> bool:
         """
@@ -51,25 +68,24 @@ class Event:
         """
         :return: String with the format "(<Event Abbreviation>, <Event Time>)".
         """
-        return f"(type={self.type}, time={self.time}, " \
+        type_name = EVENT_NAMES[self.type] if self.type is not None else None
+        return f"(type={type_name}, time={self.time}, " \
                f"entity={self.entity}, id={self.id})"
 
 
 class Arrival(Event):
     """Arrival Events signify an entity entering into the queueing system."""
-    def __init__(self, id: int = None, entity: str = None,
-                 time: Union[int, float] = 0):
-        """
-        :param id: The ID number of the event.
-        :param entity: The entity to which this event belongs.
-        :param time: The simulation time of the Event.
-        """
-        super().__init__(id, entity, time)
-        self.type = ARRIVAL
+    __slots__ = ()
+    type = ARRIVAL
+    _prio = _TYPE_PRIO[ARRIVAL]
 
 
 class Departure(Event):
     """Departure Events signify an entity exiting from the queueing system."""
+    __slots__ = ()
+    type = DEPARTURE
+    _prio = _TYPE_PRIO[DEPARTURE]
+
     def __init__(self, id: int = None, entity: str = None,
                  time: Union[int, float] = 0,
                  arrival_time: Union[int, float] = 0):
@@ -81,36 +97,38 @@ class Departure(Event):
         entity.
         """
         super().__init__(id, entity, time)
-        self.type = DEPARTURE
         self.arrival_time = arrival_time
 
 
 class ArrivalLoadingQueue(Event):
+    __slots__ = ()
+    type = ALQ
+    _prio = _TYPE_PRIO[ALQ]
+
     def __init__(self, id: int = None, time: Union[int, float] = 0):
         super().__init__(id, time=time)
-        self.type = ALQ
 
 
 class EndLoading(Event):
+    __slots__ = ()
+    type = EL
+    _prio = _TYPE_PRIO[EL]
+
     def __init__(self, id: int = None, time: Union[int, float] = 0):
         super().__init__(id, time=time)
-        self.type = EL
 
 
 class EndWeighing(Event):
+    __slots__ = ()
+    type = EW
+    _prio = _TYPE_PRIO[EW]
+
     def __init__(self, id: int = None, time: Union[int, float] = 0):
         super().__init__(id, time=time)
-        self.type = EW
 
 
 class End(Event):
     """End Events signify the end of the simulation."""
-    def __init__(self, id: int = None, entity: str = None,
-                 time: Union[int, float] = 0):
-        """
-        :param id: The ID number of the event.
-        :param entity: The entity to which this event belongs.
-        :param time: The simulation time of the Event.
-        """
-        super().__init__(id, entity, time)
-        self.type = END
+    __slots__ = ()
+    type = END
+    _prio = _TYPE_PRIO[END]
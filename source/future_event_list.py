@@ -4,98 +4,545 @@
 # Description: This file contains the logic implementing the Future Event List
 #              data structure.
 #              Depending on the value of HEAP_IMPLEMENTATION, the FEL will
-#              either use the built-in heapq Python module or the min_heap.py
-#              module (which is not built-in).
+#              either use the built-in heapq Python module, the min_heap.py
+#              module (which is not built-in), or a calendar queue.
 
+# Python Imports
+from collections import deque
+from itertools import count
+from typing import Iterable, List
 
 # Custom Imports
-from source.constants import CUSTOM_HEAP, PYTHON_HEAP
+from source.constants import CALENDAR_QUEUE, CUSTOM_HEAP, PYTHON_HEAP
 from source.events import *
 
-# Check which min-heap implementation to use; default is to use custom one.
+# Check which min-heap implementation to use; default is to use the built-in
+# heapq module, which is implemented in C. The custom min_heap.py module is
+# only used when it is selected explicitly.
 import source.flags
-if source.flags.HEAP_IMPLEMENTATION == PYTHON_HEAP:
-    import heapq as hq
-else:
-    source.flags.HEAP_IMPLEMENTATION = CUSTOM_HEAP
+if source.flags.HEAP_IMPLEMENTATION == CUSTOM_HEAP:
     import source.min_heap as hq
+else:
+    if source.flags.HEAP_IMPLEMENTATION != CALENDAR_QUEUE:
+        source.flags.HEAP_IMPLEMENTATION = PYTHON_HEAP
+    import heapq as hq
 # print(f"Using {source.flags.HEAP_IMPLEMENTATION}")
 
 
-# Store the Future Event List as a global variable.
-fel = []
-
-
-def get_next() -> Event:
+class _LazyFEL:
     """
-    Return and remove the next Event in the FEL.
+    Base class of the Future Event Lists, which discard cancelled and
+    deleted Events lazily.
 
-    :return: The next Event in the FEL.
+    Each entry is a tuple (time, priority, sequence number, Event). Cancelled
+    and deleted Events are not removed right away; instead, they are
+    discarded once they reach the front. Subclasses store the entries and
+    implement length().
     """
-    if fel:
-        return hq.heappop(fel)
+    __slots__ = ("_sequence", "_cancelled", "_deleted")
 
+    def __init__(self):
+        self._sequence = count()
+        # Each cancelled ID, and each (time, type) key of a deleted Event,
+        # maps to the sequence number at the time of the cancellation or
+        # deletion, so only the matching Events inserted before then are
+        # discarded.
+        self._cancelled = {}
+        self._deleted = {}
 
-def insert_with_priority(event: Event) -> None:
-    """
-    Insert a new Event into the FEL and maintain priority.
+    def _is_discarded(self, entry: tuple) -> bool:
+        """
+        Check whether an entry has been cancelled or deleted. If no ID has
+        been cancelled and no Event deleted, only the Event's own cancelled
+        flag is checked.
 
-    :param event: The Event to be inserted.
-    :return: None.
-    """
-    hq.heappush(fel, event)
+        :param entry: The (time, priority, sequence number, Event) entry.
+        :return: True if the entry's Event should be skipped.
+        """
+        event = entry[-1]
+        if event.cancelled:
+            return True
+        if not self._cancelled and not self._deleted:
+            return False
+        sequence = entry[2]
+        cancelled_before = self._cancelled.get(event.id)
+        if cancelled_before is not None and sequence < cancelled_before:
+            return True
+        deleted_before = self._deleted.get((event.time, event.type))
+        return deleted_before is not None and sequence < deleted_before
 
+    def delete(self, event: Event) -> None:
+        """
+        Delete all Events equal to the given Event (same time and type) from
+        the FEL. They remain in the FEL until they reach the front, at which
+        point get_next and peek discard them.
 
-def delete(event: Event) -> None:
-    """
-    Delete an Event from the FEL.
+        :param event: The Event to be deleted.
+        :return: None.
+        """
+        # If the FEL is empty, exit prematurely.
+        if not self.length():
+            return
 
-    :param event: The Event to be deleted.
-    :return: None.
-    """
-    global fel
+        self._deleted[(event.time, event.type)] = next(self._sequence)
+
+    def cancel(self, event_id: int) -> None:
+        """
+        Cancel all Events with the given ID that are in the FEL; Events
+        inserted afterwards with the same ID are kept. The cancelled Events
+        remain in the FEL until they reach the front, at which point get_next
+        and peek discard them.
+
+        :param event_id: The ID of the Events to be cancelled.
+        :return: None.
+        """
+        self._cancelled[event_id] = next(self._sequence)
+
+    def length(self) -> int:
+        """
+        Get the length of the FEL.
+
+        :return: The current length of the FEL, including cancelled and
+                 deleted Events that have not been discarded yet.
+        """
+        raise NotImplementedError
 
-    # If the FEL is empty, exit prematurely.
-    if not fel:
-        return
+    def clear(self) -> None:
+        """
+        Forget all cancellations and deletions.
 
-    # Filter out the Event to be deleted and restore the list as a heap.
-    fel = list(filter(lambda e: e not in [event], fel))
-    hq.heapify(fel)
+        :return: None.
+        """
+        self._cancelled.clear()
+        self._deleted.clear()
 
 
-def length() -> int:
+class HeapFEL(_LazyFEL):
     """
-    Get the length of the FEL.
+    Future Event List implemented as a binary min-heap.
 
-    :return: The current length of the FEL.
+    Each entry is a tuple (time, priority, sequence number, Event), so the
+    heap orders entries by comparing primitives and never calls
+    Event.__lt__. The sequence number breaks ties between Events with the
+    same time and priority in insertion order, which also keeps the Events
+    themselves from being compared.
     """
-    return len(fel)
+    __slots__ = ("_heap",)
+
+    def __init__(self):
+        super().__init__()
+        self._heap = []
+
+    def get_next(self) -> Union[None, Event]:
+        """
+        Return and remove the next Event in the FEL, skipping cancelled and
+        deleted Events. If no ID has been cancelled and no Event deleted, only
+        the Events' own cancelled flags are checked.
+
+        :return: The next Event in the FEL.
+        """
+        heap = self._heap
+        if not self._cancelled and not self._deleted:
+            while heap:
+                event = hq.heappop(heap)[-1]
+                if not event.cancelled:
+                    return event
+            return None
+        while heap:
+            entry = hq.heappop(heap)
+            if not self._is_discarded(entry):
+                return entry[-1]
+
+    def insert_with_priority(self, event: Event) -> None:
+        """
+        Insert a new Event into the FEL and maintain priority.
 
+        :param event: The Event to be inserted.
+        :return: None.
+        """
+        hq.heappush(self._heap,
+                    (event.time, event._prio, next(self._sequence), event))
 
-def peek() -> Union[None, Event]:
+    def length(self) -> int:
+        """
+        Get the length of the FEL.
+
+        :return: The current length of the FEL, including cancelled and
+                 deleted Events that have not been discarded yet.
+        """
+        return len(self._heap)
+
+    def peek(self) -> Union[None, Event]:
+        """
+        Return and next Event in the FEL without removing it.
+
+        :return: The next Event in the FEL.
+        """
+        heap = self._heap
+        while heap and self._is_discarded(heap[0]):
+            hq.heappop(heap)
+        if not heap:
+            return None
+        return heap[0][-1]
+
+    def clear(self) -> None:
+        """
+        Clear the FEL of its contents.
+
+        :return: None.
+        """
+        super().clear()
+        self._heap.clear()
+
+    def print_fel(self, logger) -> None:
+        logger.info("FEL Begin")
+        for entry in hq.nsmallest(len(self._heap), self._heap):
+            logger.info(f"event={entry[-1]}")
+        logger.info("FEL End")
+
+
+class ArrayPlusHeapFEL(HeapFEL):
     """
-    Return and next Event in the FEL without removing it.
+    Future Event List split into a static schedule and a binary min-heap.
 
-    :return: The next Event in the FEL.
+    Events known before the simulation starts, such as a pre-generated
+    arrival schedule, are kept in a sorted array and read in order with an
+    advancing position. Only the Events inserted during the simulation go
+    into the heap, so it stays as small as the number of pending dynamic
+    Events (e.g., one Departure per busy server) rather than growing with
+    the whole schedule. get_next takes whichever of the two fronts comes
+    first.
     """
-    if not fel:
-        return None
-    return fel[0]
+    __slots__ = ("_schedule", "_position")
+
+    def __init__(self, schedule: Iterable[Event] = ()):
+        """
+        :param schedule: The Events known before the simulation starts.
+        """
+        super().__init__()
+        self.set_schedule(schedule)
+
+    def set_schedule(self, schedule: Iterable[Event]) -> None:
+        """
+        Replace the static schedule of the FEL.
+
+        :param schedule: The Events known before the simulation starts.
+        :return: None.
+        """
+        self._schedule = sorted(
+            (event.time, event._prio, next(self._sequence), event)
+            for event in schedule)
+        self._position = 0
+
+    def _front(self) -> Union[None, tuple]:
+        """
+        Get the earliest entry of the schedule and the heap.
+
+        :return: The earliest entry, or None if the FEL is empty.
+        """
+        heap = self._heap
+        if self._position < len(self._schedule):
+            entry = self._schedule[self._position]
+            if not heap or entry < heap[0]:
+                return entry
+        return heap[0] if heap else None
+
+    def _pop_front(self) -> Union[None, tuple]:
+        """
+        Remove and return the earliest entry of the schedule and the heap.
+
+        :return: The earliest entry, or None if the FEL is empty.
+        """
+        entry = self._front()
+        if entry is None:
+            return None
+        if self._position < len(self._schedule) and \
+                entry is self._schedule[self._position]:
+            self._position += 1
+        else:
+            hq.heappop(self._heap)
+        return entry
+
+    def get_next(self) -> Union[None, Event]:
+        """
+        Return and remove the next Event in the FEL, skipping cancelled and
+        deleted Events.
+
+        :return: The next Event in the FEL.
+        """
+        entry = self._pop_front()
+        while entry is not None and self._is_discarded(entry):
+            entry = self._pop_front()
+        return entry[-1] if entry is not None else None
+
+    def length(self) -> int:
+        """
+        Get the length of the FEL.
 
+        :return: The current length of the FEL, including cancelled and
+                 deleted Events that have not been discarded yet.
+        """
+        return len(self._schedule) - self._position + len(self._heap)
 
-def clear() -> None:
+    def peek(self) -> Union[None, Event]:
+        """
+        Return and next Event in the FEL without removing it.
+
+        :return: The next Event in the FEL.
+        """
+        entry = self._front()
+        while entry is not None and self._is_discarded(entry):
+            self._pop_front()
+            entry = self._front()
+        return entry[-1] if entry is not None else None
+
+    def clear(self) -> None:
+        """
+        Clear the FEL of its contents, including the schedule.
+
+        :return: None.
+        """
+        super().clear()
+        self._schedule = []
+        self._position = 0
+
+    def print_fel(self, logger) -> None:
+        logger.info("FEL Begin")
+        entries = self._schedule[self._position:] + self._heap
+        for entry in sorted(entries):
+            logger.info(f"event={entry[-1]}")
+        logger.info("FEL End")
+
+
+class CalendarQueueFEL(_LazyFEL):
     """
-    Clear the FEL of its contents.
+    Future Event List implemented as a calendar queue.
+
+    Events are kept in an array of unsorted buckets ("days"), each covering
+    a fixed width of simulation time, with bucket index int(time / width)
+    mod the number of buckets. Only the Events of the current day are fully
+    sorted, in a small binary heap; when it runs empty, the queue advances
+    to the next day and heapifies that day's Events, wrapping around to the
+    first bucket at the end of each year. When event times are spread
+    roughly uniformly, inserting and removing Events take constant expected
+    time instead of the logarithmic time of a single binary heap. The number
+    of buckets doubles when the queue holds more than twice as many Events
+    as buckets, and halves when it holds fewer than half as many. Each
+    resize also re-estimates the bucket width from the spacing of the
+    earliest Events, as in Brown's calendar queue, so that each day holds
+    only a few Events.
 
-    :return: None.
+    Entries are stored as (time, priority, sequence number, Event) tuples,
+    the same as in HeapFEL.
     """
-    global fel
-    fel = []
+    __slots__ = ("_width", "_bucket_count", "_buckets", "_current", "_day",
+                 "_size")
+
+    # Number of the earliest Events sampled to estimate the bucket width.
+    width_sample_size = 25
+
+    def __init__(self, width: Union[int, float] = 1.0, bucket_count: int = 2):
+        """
+        :param width: The initial simulation time covered by each bucket; it
+        is re-estimated whenever the number of buckets changes.
+        :param bucket_count: The initial number of buckets.
+        """
+        super().__init__()
+        self._width = width
+        self._bucket_count = bucket_count
+        self._buckets = [deque() for _ in range(bucket_count)]
+        self._current = []  # Heap of the current day's Events.
+        self._day = 0
+        self._size = 0
+
+    def _estimate_width(self, times: List[Union[int, float]]) -> None:
+        """
+        Estimate the bucket width from the earliest Event times: three times
+        their average separation, ignoring separations larger than twice the
+        average. The width is kept if the times are not spread out.
+
+        :param times: The sorted times of the earliest Events.
+        :return: None.
+        """
+        separations = [later - earlier
+                       for earlier, later in zip(times, times[1:])]
+        if not separations:
+            return
+        average = sum(separations) / len(separations)
+        close = [separation for separation in separations
+                 if separation <= 2 * average]
+        average = sum(close) / len(close)
+        if average > 0:
+            self._width = 3 * average
+
+    def _resize(self, bucket_count: int) -> None:
+        """
+        Re-estimate the bucket width and redistribute all Events into a new
+        number of buckets.
+
+        :param bucket_count: The new number of buckets.
+        :return: None.
+        """
+        entries = self._current + [entry for bucket in self._buckets
+                                   for entry in bucket]
+        times = sorted(entry[0] for entry in entries)
+        self._estimate_width(times[:self.width_sample_size])
+
+        # Restart the calendar at the day of the earliest Event.
+        self._bucket_count = bucket_count
+        self._buckets = [deque() for _ in range(bucket_count)]
+        self._current = []
+        self._day = int(times[0] / self._width) if times else 0
+        for entry in entries:
+            day = int(entry[0] / self._width)
+            if day <= self._day:
+                self._current.append(entry)
+            else:
+                self._buckets[day % bucket_count].append(entry)
+        hq.heapify(self._current)
+
+    def _advance(self) -> bool:
+        """
+        Advance to the next day holding any Events and move them into the
+        current day's heap.
+
+        :return: True if an Event is available, or False if the queue is
+                 empty.
+        """
+        if self._current:
+            return True
+        if not self._size:
+            return False
+
+        # Search the buckets for an Event within the current year, wrapping
+        # around to the first bucket after the last one.
+        for _ in range(self._bucket_count):
+            self._day += 1
+            if self._load_day():
+                return True
+
+        # No Event is due this year, so jump straight to the earliest one.
+        self._day = min(int(entry[0] / self._width)
+                        for bucket in self._buckets for entry in bucket)
+        return self._load_day()
 
+    def _load_day(self) -> bool:
+        """
+        Move the Events of the current day from their bucket into the heap.
 
-def print_fel(logger) -> None:
-    logger.info("FEL Begin")
-    for event in hq.nsmallest(len(fel), fel):
-        logger.info(f"event={event}")
-    logger.info("FEL End")
+        :return: True if the current day holds any Events.
+        """
+        bucket = self._buckets[self._day % self._bucket_count]
+        if not bucket:
+            return False
+        later = deque()
+        for entry in bucket:
+            if int(entry[0] / self._width) == self._day:
+                self._current.append(entry)
+            else:
+                later.append(entry)
+        self._buckets[self._day % self._bucket_count] = later
+        hq.heapify(self._current)
+        return bool(self._current)
+
+    def _pop_next(self) -> Union[None, tuple]:
+        """
+        Remove and return the entry with the earliest time.
+
+        :return: The next entry, or None if the queue is empty.
+        """
+        if not self._advance():
+            return None
+        entry = hq.heappop(self._current)
+        self._size -= 1
+        if self._bucket_count > 2 and self._size < self._bucket_count // 2:
+            self._resize(self._bucket_count // 2)
+        return entry
+
+    def get_next(self) -> Union[None, Event]:
+        """
+        Return and remove the next Event, skipping cancelled and deleted
+        Events.
+
+        :return: The next Event in the FEL.
+        """
+        entry = self._pop_next()
+        while entry is not None and self._is_discarded(entry):
+            entry = self._pop_next()
+        return entry[-1] if entry is not None else None
+
+    def insert_with_priority(self, event: Event) -> None:
+        """
+        Insert a new Event into its bucket and maintain priority.
+
+        :param event: The Event to be inserted.
+        :return: None.
+        """
+        entry = (event.time, event._prio, next(self._sequence), event)
+        day = int(event.time / self._width)
+
+        # Events due by the current day, including any scheduled before it,
+        # go straight into the current day's heap.
+        if day <= self._day:
+            hq.heappush(self._current, entry)
+        else:
+            self._buckets[day % self._bucket_count].append(entry)
+        self._size += 1
+        if self._size > 2 * self._bucket_count:
+            self._resize(2 * self._bucket_count)
+
+    def length(self) -> int:
+        """
+        Get the number of Events in the FEL.
+
+        :return: The current length of the FEL, including cancelled and
+                 deleted Events that have not been discarded yet.
+        """
+        return self._size
+
+    def peek(self) -> Union[None, Event]:
+        """
+        Return the next Event without removing it.
+
+        :return: The next Event in the FEL.
+        """
+        while self._advance() and self._is_discarded(self._current[0]):
+            self._pop_next()
+        return self._current[0][-1] if self._current else None
+
+    def clear(self) -> None:
+        """
+        Clear the FEL of its contents.
+
+        :return: None.
+        """
+        super().clear()
+        self._bucket_count = 2
+        self._buckets = [deque(), deque()]
+        self._current = []
+        self._day = 0
+        self._size = 0
+
+    def print_fel(self, logger) -> None:
+        logger.info("FEL Begin")
+        entries = self._current + [entry for bucket in self._buckets
+                                   for entry in bucket]
+        for entry in sorted(entries):
+            logger.info(f"event={entry[-1]}")
+        logger.info("FEL End")
+
+
+# Store the Future Event List as a global instance of the selected
+# implementation, and expose its methods as the module functions.
+if source.flags.HEAP_IMPLEMENTATION == CALENDAR_QUEUE:
+    event_list = CalendarQueueFEL()
+else:
+    event_list = HeapFEL()
+get_next = event_list.get_next
+insert_with_priority = event_list.insert_with_priority
+delete = event_list.delete
+cancel = event_list.cancel
+length = event_list.length
+peek = event_list.peek
+clear = event_list.clear
+print_fel = event_list.print_fel
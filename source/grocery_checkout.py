@@ -5,26 +5,37 @@
 #              Grocery Checkout DES model.
 
 # Python Imports
-from typing import Any, Dict, List, Tuple
+from collections import deque
+from math import inf
+from multiprocessing import Pool
+from typing import Any, Dict, List, Tuple, Union
+
+# Third-Party Imports
+import numpy as np
 
 # Custom Imports
 from source.constants import *
-from source.events import Arrival, Departure
-import source.future_event_list as fel
 import source.random_variate_generators as rvg
 
-# Global Variables
-uuid = -1
-
-
-def get_uuid() -> int:
-    """
-    Generates a new UUID.
-    :return: A UUID as an integer.
-    """
-    global uuid
-    uuid += 1
-    return uuid
+# Keys of the execution parameters and calculated statistics of a trial.
+# Their formatted labels are built once here, rather than on every trial.
+KNOWN_KEYS = (
+    "mean_interarrival_time",
+    "mean_service_time",
+    "std_dev_service_time",
+    "number_of_customers_served",
+    "server_utilization",
+    "maximum_queue_length",
+    "mean_response_time",
+    "long_response_ratio",
+    "simulation_run_duration",
+    "number_of_arrivals",
+    "number_of_departures",
+)
+_KEY_PREFIX = {key: f"\t\t{key.replace('_', ' ').capitalize():<35}\t"
+               for key in KNOWN_KEYS}
+# Keys whose values are measured in minutes.
+_TIME_KEYS = {key for key in KNOWN_KEYS if "time" in key or "duration" in key}
 
 
 def grocery_checkout(trial: int,
@@ -32,7 +43,8 @@ def grocery_checkout(trial: int,
                      service_mean: float = 3.2,
                      service_std: float = 0.6,
                      long_response_threshold: float = 4.0,
-                     customer_limit: int = 1000) -> Tuple[float, List[str]]:
+                     customer_limit: int = 1000,
+                     seed: int = None) -> Tuple[float, List[str]]:
     """
     Execute a single trial of the Grocery Checkout DES model.
     :param trial: Trial index.
@@ -42,142 +54,196 @@ def grocery_checkout(trial: int,
     :param long_response_threshold: Threshold for a service to be considered
     a 'long' response.
     :param customer_limit: End the simulation when this many customers depart.
+    :param seed: Seed for this trial's random number generator.
     :return: A tuple, where the first element is the mean response time,
     and the second element is the formatted output of the trial's execution
     parameters and calculated statistics.
     """
-    clock = 0
-    server = IDLE
-    queue = []
-    statistics = {
-        "arrival_count": 0,
-        "departure_count": 0,
-        "cumulative_delay": 0,
-        "cumulative_time_busy": 0,
-        "current_queue_length": 0,
-        "maximum_queue_length": 0,
-        "cumulative_response_time": 0,
-        "long_response_count": 0,
-        "cumulative_interarrival_time": 0,
-        "cumulative_service_time": 0,
-        "service_started_count": 0,
+    if seed is not None:
+        rvg.set_seed(seed)
+
+    # Draw the arrival schedule up front, since interarrival times do not
+    # depend on the state of the simulation. arrival_times[k] is the time of
+    # the arrival scheduled after the k-th one (counting from 0).
+    arrival_times = np.cumsum(
+        rvg.exponentials(interarrival_mean, customer_limit + 100)).tolist()
+
+    totals = run_simulation(arrival_times, interarrival_mean, service_mean,
+                            service_std, long_response_threshold,
+                            customer_limit)
+    clock = totals["clock"]
+    arrival_count = totals["arrival_count"]
+    departure_count = totals["departure_count"]
+
+    # Get formatted output.
+    mean_response_time = totals["cumulative_response_time"] / departure_count
+    parameters = {
+        "mean_interarrival_time": interarrival_mean,
+        "mean_service_time": service_mean,
+        "std_dev_service_time": service_std,
+        "number_of_customers_served": customer_limit
     }
+    calculated_statistics = {
+        "server_utilization": totals["cumulative_time_busy"] / clock,
+        "maximum_queue_length": totals["maximum_queue_length"],
+        "mean_response_time": mean_response_time,
+        "long_response_ratio": totals["long_response_count"] /
+                               departure_count,
+        "simulation_run_duration": clock,
+        "number_of_arrivals": arrival_count,
+        "number_of_departures": departure_count,
+        "mean_interarrival_time": totals["cumulative_interarrival_time"] /
+                                  arrival_count,
+        "mean_service_time": totals["cumulative_service_time"] /
+                             totals["service_started_count"],
+    }
+    output = format_output(trial,
+                           "Single-queue, single-server - Grocery Checkout",
+                           parameters,
+                           calculated_statistics)
 
-    # Initialize FEL with first arrival.
-    event = Arrival(id=get_uuid(), time=0.0)
-    fel.clear()
-    fel.insert_with_priority(event)
-    previous_event = event
+    # Return the mean response time and the formatted output.
+    return mean_response_time, output
 
-    # Main loop; process events until departure limit.
-    while statistics["departure_count"] < customer_limit:
-        current_event = fel.get_next()
-        clock = current_event.time
 
-        # Update the time which the server is busy.
-        if server is BUSY:
-            time_busy = current_event.time - previous_event.time
-            statistics["cumulative_time_busy"] += time_busy
+def run_simulation(arrival_times: List[float],
+                   interarrival_mean: float,
+                   service_mean: float,
+                   service_std: float,
+                   long_response_threshold: float,
+                   customer_limit: int) -> Dict[str, Union[int, float]]:
+    """
+    Run the event loop of the Grocery Checkout DES model until customer_limit
+    customers have departed.
+    :param arrival_times: The pre-drawn arrival schedule; it is extended in
+    place if more arrivals are needed.
+    :param interarrival_mean: Average time between arrivals, used to extend
+    the arrival schedule.
+    :param service_mean: Average time for servicing customers.
+    :param service_std: Standard deviation for servicing customers.
+    :param long_response_threshold: Threshold for a service to be considered
+    a 'long' response.
+    :param customer_limit: End the simulation when this many customers depart.
+    :return: The final simulation time ("clock") and the totals of the
+    statistics, by name.
+    """
+    clock = 0
+    server_busy = False
+    # Arrival times of the customers waiting in line, served first-in
+    # first-out.
+    queue = deque()
+
+    # Keep some statistics of the simulation.
+    arrival_count = 0
+    departure_count = 0
+    cumulative_time_busy = 0
+    current_queue_length = 0
+    maximum_queue_length = 0
+    cumulative_response_time = 0
+    long_response_count = 0
+    cumulative_service_time = 0
+    service_started_count = 0
+
+    # Bind the random variate functions used in the loop to locals.
+    normal = rvg.normal
+    truncated_normal = rvg.truncated_normal
+
+    # With a single server, at most two events are pending at any time: the
+    # next Arrival, and the Departure of the customer being served. Keep them
+    # in plain variables instead of an FEL; there is no pending Departure
+    # while the server is idle.
+    next_arrival_time = 0.0
+    departure_time = inf
+    departure_arrival_time = None
+    previous_time = 0.0
+
+    # Main loop; process events until departure limit.
+    while departure_count < customer_limit:
+        # Handle arrival logic; an Arrival at the same time as the Departure
+        # is handled first.
+        if next_arrival_time <= departure_time:
+            clock = next_arrival_time
 
-        # Handle arrival logic.
-        if current_event.type is ARRIVAL:
             # Add this customer to the queue if the server is busy.
-            if server is BUSY:
-                # Update the queue.
-                statistics["current_queue_length"] += 1
-                queue.append((current_event.id, current_event.time))
+            if server_busy:
+                # Update the time which the server is busy, and the queue.
+                cumulative_time_busy += clock - previous_time
+                current_queue_length += 1
+                queue.append(clock)
 
             # Otherwise, service this customer.
             else:
-                server = BUSY
+                server_busy = True
 
                 # Generate a Departure event for this customer.
-                service_time = rvg.truncated_normal(service_mean,
-                                                    service_std,
-                                                    a=0)
-                event = Departure(id=current_event.id,
-                                  time=clock + service_time,
-                                  arrival_time=current_event.time)
-                fel.insert_with_priority(event)
+                service_time = truncated_normal(service_mean, service_std,
+                                                a=0)
+                departure_time = clock + service_time
+                departure_arrival_time = clock
 
                 # Collect statistics.
-                statistics["cumulative_service_time"] += service_time
-                statistics["service_started_count"] += 1
+                cumulative_service_time += service_time
+                service_started_count += 1
 
-            # Regardless, generate a new Arrival event.
-            interarrival_time = rvg.exponential(interarrival_mean)
-            event = Arrival(id=get_uuid(), time=clock + interarrival_time)
-            fel.insert_with_priority(event)
+            # Regardless, generate a new Arrival event. Customers still in line
+            # at the end may need the schedule to be extended.
+            if arrival_count == len(arrival_times):
+                more_times = np.cumsum(rvg.exponentials(interarrival_mean,
+                                                        customer_limit))
+                arrival_times.extend((arrival_times[-1] + more_times).tolist())
+            next_arrival_time = arrival_times[arrival_count]
 
             # Collect statistics.
-            statistics["cumulative_interarrival_time"] += interarrival_time
-            statistics["arrival_count"] += 1
-            statistics["maximum_queue_length"] = \
-                max(statistics["maximum_queue_length"],
-                    statistics["current_queue_length"])
+            arrival_count += 1
+            if current_queue_length > maximum_queue_length:
+                maximum_queue_length = current_queue_length
 
         # Handle departure logic.
-        elif current_event.type is DEPARTURE:
+        else:
+            clock = departure_time
+
+            # Update the time which the server is busy.
+            cumulative_time_busy += clock - previous_time
+
             # Collect statistics.
-            arrival_time = current_event.arrival_time
-            response_time = clock - arrival_time
+            response_time = clock - departure_arrival_time
             if response_time >= long_response_threshold:
-                statistics["long_response_count"] += 1
-            statistics["cumulative_response_time"] += response_time
-            statistics["departure_count"] += 1
+                long_response_count += 1
+            cumulative_response_time += response_time
+            departure_count += 1
 
             # The server is idle when there are no customers in the queue.
-            if statistics["current_queue_length"] <= 0:
-                server = IDLE
+            if current_queue_length <= 0:
+                server_busy = False
+                departure_time = inf
 
             # Service the next customer.
             else:
                 # Generate a new Departure event for the next customer in line.
-                service_time = rvg.normal(service_mean, service_std)
-                event_id, arrival_time = queue.pop()
-                event = Departure(id=event_id,
-                                  time=clock + service_time,
-                                  arrival_time=arrival_time)
-                fel.insert_with_priority(event)
+                service_time = normal(service_mean, service_std)
+                departure_arrival_time = queue.popleft()
+                departure_time = clock + service_time
 
                 # Collect statistics.
-                statistics["current_queue_length"] -= 1
-                statistics["cumulative_service_time"] += service_time
-                statistics["service_started_count"] += 1
-
-        # Save this event for later.
-        previous_event = current_event
-
-    # Get formatted output.
-    mean_response_time = \
-        statistics["cumulative_response_time"] / statistics["departure_count"]
-    parameters = {
-        "mean_interarrival_time": interarrival_mean,
-        "mean_service_time": service_mean,
-        "std_dev_service_time": service_std,
-        "number_of_customers_served": customer_limit
-    }
-    calculated_statistics = {
-        "server_utilization": statistics["cumulative_time_busy"] / clock,
-        "maximum_queue_length": statistics["maximum_queue_length"],
-        "mean_response_time": mean_response_time,
-        "long_response_ratio": statistics["long_response_count"] /
-                               statistics["departure_count"],
-        "simulation_run_duration": clock,
-        "number_of_arrivals": statistics["arrival_count"],
-        "number_of_departures": statistics["departure_count"],
-        "mean_interarrival_time": statistics["cumulative_interarrival_time"] /
-                                  statistics["arrival_count"],
-        "mean_service_time": statistics["cumulative_service_time"] /
-                             statistics["service_started_count"],
+                current_queue_length -= 1
+                cumulative_service_time += service_time
+                service_started_count += 1
+
+        # Save this event's time for later.
+        previous_time = clock
+
+    return {
+        "clock": clock,
+        "arrival_count": arrival_count,
+        "departure_count": departure_count,
+        "cumulative_time_busy": cumulative_time_busy,
+        "maximum_queue_length": maximum_queue_length,
+        "cumulative_response_time": cumulative_response_time,
+        "long_response_count": long_response_count,
+        "cumulative_interarrival_time": arrival_times[arrival_count - 1],
+        "cumulative_service_time": cumulative_service_time,
+        "service_started_count": service_started_count,
     }
-    output = format_output(trial,
-                           "Single-queue, single-server - Grocery Checkout",
-                           parameters,
-                           calculated_statistics)
-
-    # Return the mean response time and the formatted output.
-    return mean_response_time, output
 
 
 def format_output(trial: int,
@@ -199,18 +265,17 @@ def format_output(trial: int,
     ]
 
     for key, value in parameters.items():
-        format_str = f"\t\t{key.replace('_', ' ').capitalize():<35}\t"
-        format_str += f"{value}"
-        if "time" in key:
+        format_str = _KEY_PREFIX[key] + f"{value}"
+        if key in _TIME_KEYS:
             format_str += " minutes"
         lines.append(format_str)
     lines.append("")
 
     lines.append("\tCalculated statistics")
     for key, value in statistics.items():
-        format_str = f"\t\t{key.replace('_', ' ').capitalize():<35}\t"
+        format_str = _KEY_PREFIX[key]
         format_str += f"{value}" if isinstance(value, int) else f"{value:.4f}"
-        if "time" in key or "duration" in key:
+        if key in _TIME_KEYS:
             format_str += " minutes"
         lines.append(format_str)
     lines.append("")
@@ -218,23 +283,36 @@ def format_output(trial: int,
     return lines
 
 
+def run_trial(trial: int) -> Tuple[float, List[str]]:
+    """
+    Execute a single, reproducible trial of the Grocery Checkout DES model.
+    The trial reseeds the shared rvg generator first, so its results depend
+    on the seed and not on which worker process runs it.
+    :param trial: Trial index, also used to seed the trial.
+    :return: The result of grocery_checkout for this trial.
+    """
+    return grocery_checkout(trial, seed=trial)
+
+
 def main():
     # Run 30 trials of the Grocery Checkout DES model.
+    # Trials are independent, so run them in parallel.
     trial_count = 30
-    trials = [grocery_checkout(trial_index)
-              for trial_index in range(1, trial_count + 1)]
+    with Pool() as pool:
+        trials = pool.map(run_trial, range(1, trial_count + 1))
 
-    # Write the results of each trial to an output file.
+    # Write the results of each trial to an output file with a single write.
     # Also, write the mean response time from all trials to the file.
+    lines = []
     mean_response_times = []
-    with open(f"{OUTPUT_DIRECTORY}grocery_checkout.txt", "w") as fp:
-        for mean_response_time, output in trials:
-            mean_response_times.append(mean_response_time)
-            for lines in output:
-                fp.writelines(lines + "\n")
-        fp.write(f"Mean response time over {trial_count} trials: "
+    for mean_response_time, output in trials:
+        mean_response_times.append(mean_response_time)
+        lines.extend(output)
+    lines.append(f"Mean response time over {trial_count} trials: "
                  f"{sum(mean_response_times) / len(mean_response_times):.4f}"
                  f" minutes")
+    with open(f"{OUTPUT_DIRECTORY}grocery_checkout.txt", "w") as fp:
+        fp.write("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@
 #              data structure.
 
 # Python Imports
+import heapq
 from typing import Any, List
 
 # These are the functions needed to implement the FEL.
@@ -67,7 +68,7 @@ def nsmallest(n: int, heap: List[Any]) -> List[Any]:
     :param heap: The heap object.
     :return: The sorted "heap" list.
     """
-    return sorted(heap)[:n]
+    return heapq.nsmallest(n, heap)
 
 
 # ------------------------------------------------------------------------------
@@ -132,23 +133,25 @@ def sift_down(heap: List[Any], start_index: int) -> None:
 
     # Continue to swap elements in the heap until it is restored.
     while child_index < end_index:
-        # Get the current node's left and right elements.
-        right_child_index = child_index + 1
+        # Pick the smaller of the current node's children; the right child is
+        # only read when it exists.
         child_element = heap[child_index]
-        right_child_element = heap[right_child_index] \
-            if right_child_index < end_index else None
-
-        # Swap the child index with the smaller of the two children.
-        if right_child_index < end_index and \
-                right_child_element < child_element:
-            child_index = right_child_index
-
-        # Swap with the smaller child and go further down the heap.
-        heap[current_index] = heap[child_index]
+        right_child_index = child_index + 1
+        if right_child_index < end_index:
+            right_child_element = heap[right_child_index]
+            if right_child_element < child_element:
+                child_index = right_child_index
+                child_element = right_child_element
+
+        # Stop once the new element is no larger than the smaller child.
+        if not child_element < new_element:
+            break
+
+        # Swap with the smaller child and go further down the heap. The left
+        # child index is computed inline, as in get_child_index.
+        heap[current_index] = child_element
         current_index = child_index
-        child_index = get_child_index(current_index)
+        child_index = 2 * current_index + 1
 
-    # The heap now has a free space at current_index, so add the new element
-    # and finish restoring the heap by sifting up.
+    # The heap now has a free space at current_index, so add the new element.
     heap[current_index] = new_element
-    sift_up(heap, start_index, current_index)
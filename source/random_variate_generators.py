@@ -10,9 +10,17 @@ from typing import List, Union
 import numpy as np
 
 # Global Variables
-saved_x = None
 rng = np.random.default_rng()
 
+# Standard variates are generated in batches of BUFFER_SIZE, then handed out
+# one per call and scaled to the requested distribution.
+BUFFER_SIZE = 4096
+exponential_buffer = []
+# Standard normal variates, by use_np.
+normal_buffers = {False: [], True: []}
+# Accepted truncated normal variates, by (mu, sigma, a, b, use_np).
+truncated_normal_pools = {}
+
 
 def set_seed(seed: int):
     """
@@ -21,6 +29,32 @@ def set_seed(seed: int):
     """
     global rng
     rng = np.random.default_rng(seed)
+    exponential_buffer.clear()
+    for buffer in normal_buffers.values():
+        buffer.clear()
+    truncated_normal_pools.clear()
+
+
+def standard_normals(size: int, use_np: bool = False) -> np.ndarray:
+    """
+    Generate a batch of random variates from the standard normal distribution.
+    :param size: The number of variates to generate.
+    :param use_np: Specifies whether to use the numpy normal RVG.
+    :return: An array of standard normal random variates.
+    """
+    if use_np:
+        return rng.standard_normal(size)
+
+    # Apply the Box-Muller transform to pairs of uniforms; each pair yields
+    # two independent variates.
+    pair_count = (size + 1) // 2
+    r1 = rng.uniform(0, 1, pair_count)
+    r2 = rng.uniform(0, 1, pair_count)
+    temp = np.sqrt(-2 * np.log(r1))
+    x = np.empty(2 * pair_count)
+    x[0::2] = temp * np.cos(2 * np.pi * r2)
+    x[1::2] = temp * np.sin(2 * np.pi * r2)
+    return x[:size]
 
 
 def normal(mu: float, sigma: float, use_np: bool = False) -> float:
@@ -31,22 +65,10 @@ def normal(mu: float, sigma: float, use_np: bool = False) -> float:
     :param use_np: Specifies whether to use the numpy normal RVG.
     :return: A random variate from the normal distribution.
     """
-    if use_np:
-        x = rng.normal(mu, sigma)
-    else:
-        global saved_x
-        if saved_x is None:
-            r1 = rng.uniform(0, 1)
-            r2 = rng.uniform(0, 1)
-            temp = np.sqrt(-2 * np.log(r1))
-            x = temp * np.cos(2 * np.pi * r2)
-            saved_x = temp * np.sin(2 * np.pi * r2)
-        else:
-            x = saved_x
-            saved_x = None
-        x = x * sigma + mu
-
-    return x
+    buffer = normal_buffers[use_np]
+    if not buffer:
+        buffer.extend(standard_normals(BUFFER_SIZE, use_np).tolist())
+    return buffer.pop() * sigma + mu
 
 
 def truncated_normal(mu: float,
@@ -65,10 +87,14 @@ def truncated_normal(mu: float,
     :return: A random variate from the normal distribution
     (bounded by a <= x <= b).
     """
-    x = normal(mu, sigma, use_np)
-    while not a <= x <= b:
-        x = normal(mu, sigma, use_np)
-    return x
+    # Reject out-of-bounds variates a whole batch at a time, and keep the
+    # accepted ones for later calls with the same parameters.
+    key = (mu, sigma, a, b, use_np)
+    pool = truncated_normal_pools.setdefault(key, [])
+    while not pool:
+        x = standard_normals(BUFFER_SIZE, use_np) * sigma + mu
+        pool.extend(x[(a <= x) & (x <= b)].tolist())
+    return pool.pop()
 
 
 def exponential(beta: float, use_np: bool = False) -> float:
@@ -81,11 +107,29 @@ def exponential(beta: float, use_np: bool = False) -> float:
     if use_np:
         x = rng.exponential(beta)
     else:
-        r = rng.uniform(0, 1)
-        x = -beta * np.log(r)
+        if not exponential_buffer:
+            exponential_buffer.extend(exponentials(1, BUFFER_SIZE).tolist())
+        x = beta * exponential_buffer.pop()
     return x
 
 
+def exponentials(beta: float, size: int, use_np: bool = False) -> np.ndarray:
+    """
+    Generate a batch of random variates from the exponential distribution.
+    :param beta: The scale of the distribution (i.e., the inverse of the rate,
+    1 / lambda).
+    :param size: The number of variates to generate.
+    :param use_np: Specifies whether to use the numpy exponential RVG.
+    :return: An array of random variates from the exponential distribution.
+    """
+    if use_np:
+        return rng.exponential(beta, size)
+
+    # Apply the inverse transform to a whole batch of uniforms at once.
+    r = rng.uniform(0, 1, size)
+    return -beta * np.log(r)
+
+
 def empirical(variates: List[Union[int, float]],
               probabilities: List[float]) -> Union[int, float]:
     """
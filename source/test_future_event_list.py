@@ -12,7 +12,7 @@ import unittest
 
 # Custom Imports
 from source.constants import *
-from source.events import Arrival, Departure, End
+from source.events import Arrival, Departure
 # Set appropriate flags before importing the rest.
 import source.flags
 source.flags.HEAP_IMPLEMENTATION = CUSTOM_HEAP
@@ -42,9 +42,10 @@ class TestFutureEventList(unittest.TestCase):
         inserts = 0
         get_nexts = 0
 
-        # Insert event_count event notices with random times.
+        # Insert event_count event notices with random times. End Events are
+        # not inserted, since a model schedules only one, at its end time.
         for index in range(operation_count):
-            event_type = random.choice([Arrival, Departure, End])
+            event_type = random.choice([Arrival, Departure])
             event = event_type(index, time)
             self.logger.info(f"insert, event={event}")
             fel.insert_with_priority(event)
@@ -159,3 +160,151 @@ class TestFutureEventList(unittest.TestCase):
         self.assertEqual(expected_events, observed_events,
                          f"Expected order of events do not match the"
                          f"observed order of events.")
+
+    def test_04_delete_then_insert(self) -> None:
+        # Clear the FEL.
+        fel.clear()
+
+        # Get the Logger for writing output.
+        frame = inspect.currentframe()
+        self.logger.info(inspect.getframeinfo(frame).function)
+
+        # Deleting an Event should only remove the matching Events that are
+        # already in the FEL, not ones inserted afterwards.
+        fel.insert_with_priority(Arrival(time=10, id=1))
+        fel.insert_with_priority(Arrival(time=20, id=2))
+        fel.delete(Arrival(time=10))
+        fel.insert_with_priority(Arrival(time=10, id=3))
+
+        fel.print_fel(self.logger)
+
+        observed_ids = []
+        event = fel.get_next()
+        while event:
+            observed_ids.append(event.id)
+            event = fel.get_next()
+        self.assertEqual([3, 2], observed_ids,
+                         f"Only Events inserted before the delete should "
+                         f"be deleted.")
+
+    def test_05_cancel_then_get_next(self) -> None:
+        # Clear the FEL.
+        fel.clear()
+
+        # Get the Logger for writing output.
+        frame = inspect.currentframe()
+        self.logger.info(inspect.getframeinfo(frame).function)
+
+        # Insert five Events, then cancel two of them: one by ID and one by
+        # flagging the Event itself. An Event inserted after the cancellation
+        # reuses the cancelled ID, and should be kept.
+        events = [Arrival(time=10 * index, id=index) for index in range(1, 6)]
+        for event in events:
+            fel.insert_with_priority(event)
+        fel.cancel(1)
+        events[3].cancelled = True
+        fel.insert_with_priority(Arrival(time=60, id=1))
+
+        fel.print_fel(self.logger)
+
+        # Cancelled Events should never be returned.
+        self.assertEqual(events[1], fel.peek(),
+                         f"peek should skip cancelled Events.")
+        observed_ids = []
+        event = fel.get_next()
+        while event:
+            observed_ids.append(event.id)
+            event = fel.get_next()
+        self.assertEqual([2, 3, 5, 1], observed_ids,
+                         f"Cancelled Events should be skipped by get_next.")
+
+    def test_06_calendar_queue(self, operation_count: int = 1000) -> None:
+        # Use a standalone calendar queue, regardless of the selected FEL.
+        calendar_queue = fel.CalendarQueueFEL(width=2)
+
+        # Get the Logger for writing output.
+        frame = inspect.currentframe()
+        self.logger.info(inspect.getframeinfo(frame).function)
+
+        inserts = 0
+        get_nexts = 0
+        prev_time = 0
+
+        # Randomly perform get_next and insert_with_priority, so the number
+        # of buckets grows and shrinks along the way.
+        for index in range(operation_count):
+            r = random.random()
+            if r < 0.45 and calendar_queue.length() > 0:
+                event = calendar_queue.get_next()
+                self.assertGreaterEqual(event.time, prev_time,
+                                        f"Events should be in ascending "
+                                        f"time order.")
+                prev_time = event.time
+                get_nexts += 1
+            else:
+                event = Arrival(index, prev_time + random.uniform(0, 50))
+                calendar_queue.insert_with_priority(event)
+                inserts += 1
+
+        calendar_queue.print_fel(self.logger)
+        self.assertEqual(inserts - get_nexts, calendar_queue.length(),
+                         f"Length of FEL does not match expected length.")
+
+        # Drain the remaining events, which should also be in order.
+        event = calendar_queue.get_next()
+        while event:
+            self.assertGreaterEqual(event.time, prev_time,
+                                    f"Events should be in ascending "
+                                    f"time order.")
+            prev_time = event.time
+            get_nexts += 1
+            event = calendar_queue.get_next()
+        self.assertEqual(inserts, get_nexts,
+                         f"Number of events deleted does not match number"
+                         f"of events inserted.")
+
+    def test_07_array_plus_heap(self, operation_count: int = 200) -> None:
+        # Use a standalone FEL with a pre-generated arrival schedule.
+        arrivals = [Arrival(index, 5 * index) for index in range(50)]
+        array_plus_heap = fel.ArrayPlusHeapFEL(reversed(arrivals))
+
+        # Get the Logger for writing output.
+        frame = inspect.currentframe()
+        self.logger.info(inspect.getframeinfo(frame).function)
+
+        inserts = len(arrivals)
+        get_nexts = 0
+        prev_time = 0
+
+        # Randomly perform get_next and insert_with_priority; the inserted
+        # Departures are interleaved with the scheduled Arrivals.
+        for index in range(operation_count):
+            r = random.random()
+            if r < 0.5 and array_plus_heap.length() > 0:
+                event = array_plus_heap.get_next()
+                self.assertGreaterEqual(event.time, prev_time,
+                                        f"Events should be in ascending "
+                                        f"time order.")
+                prev_time = event.time
+                get_nexts += 1
+            else:
+                event = Departure(index, prev_time + random.randint(0, 10))
+                array_plus_heap.insert_with_priority(event)
+                inserts += 1
+
+        array_plus_heap.print_fel(self.logger)
+        self.assertEqual(inserts - get_nexts, array_plus_heap.length(),
+                         f"Length of FEL does not match expected length.")
+
+        # Drain the remaining events, which should also be in order.
+        event = array_plus_heap.get_next()
+        while event:
+            self.assertGreaterEqual(event.time, prev_time,
+                                    f"Events should be in ascending "
+                                    f"time order.")
+            prev_time = event.time
+            get_nexts += 1
+            event = array_plus_heap.get_next()
+        self.assertEqual(inserts, get_nexts,
+                         f"Number of events deleted does not match number"
+                         f"of events inserted.")